@@ -4,7 +4,16 @@ from functools import cache
 
 _defaultState = {
     'last_dependency_check': datetime(1900, 1, 1).isoformat(),
-    'first_run': True
+    # Same as last_dependency_check, as seconds since the epoch
+    'last_dependency_check_epoch': 0.,
+    'first_run': True,
+    # Time (as seconds since the epoch) of the last successful run of each
+    # dependency check (see maelzel.dependencies.checkDependencies)
+    'last_check_csound': 0.,
+    'last_check_lilypond': 0.,
+    'last_check_csoundplugins': 0.,
+    'last_check_vamp': 0.,
+    'last_check_csoundengine': 0.
 }
 
 
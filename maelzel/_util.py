@@ -287,39 +287,19 @@ def pythonSessionType() -> str:
         return "python"
 
 
-@functools.cache
-def getPlatform(normalize=True) -> tuple[str, str]:
-    """
-    Return a string with current platform (system and machine architecture).
-
-    Args:
-        normalize: if True, architectures are normalized (see below)
-    Returns:
-        a tuple (osname: str, architecture: str)
+_machineNormalizations = {
+    'x64': 'x86_64',
+    'aarch64': 'arm64',
+    'amd64': 'x86_64'
+}
 
-    This attempts to improve upon `sysconfig.get_platform` by fixing some
-    issues when running a Python interpreter with a different architecture than
-    that of the system (e.g. 32bit on 64bit system, or a multiarch build),
-    which should return the machine architecture of the currently running
-    interpreter rather than that of the system (which didn't seem to work
-    properly). The reported machine architectures follow platform-specific
-    naming conventions (e.g. "x86_64" on Linux, but "x64" on Windows).
-    Use normalize=True to reduce those labels (returns one of 'x86_64', 'arm64', 'x86')
-    Example output for common platforms (normalized):
-
-        ('darwin', 'arm64')
-        ('darwin', 'x86_64')
-        ('linux', 'x86_64')
-        ('windows', 'x86_64')
-        ...
-
-    Normalizations:
-
-    * aarch64 -> arm64
-    * x64 -> x86_64
-    * amd64 -> x86_64
 
+@functools.cache
+def _rawPlatform() -> tuple[str, str]:
+    """
+    Return the system and the (non-normalized) machine architecture
 
+    This queries the platform, which is expensive. See :func:`getPlatform`
     """
     import platform
     import sysconfig
@@ -367,13 +347,45 @@ def getPlatform(normalize=True) -> tuple[str, str]:
         else:
             machine = "i386"
 
-    if normalize:
-        machine = {
-            'x64': 'x86_64',
-            'aarch64': 'arm64',
-            'amd64': 'x86_64'
-        }.get(machine, machine)
+    return system, machine
+
 
+def getPlatform(normalize=True) -> tuple[str, str]:
+    """
+    Return a string with current platform (system and machine architecture).
+
+    Args:
+        normalize: if True, architectures are normalized (see below)
+    Returns:
+        a tuple (osname: str, architecture: str)
+
+    This attempts to improve upon `sysconfig.get_platform` by fixing some
+    issues when running a Python interpreter with a different architecture than
+    that of the system (e.g. 32bit on 64bit system, or a multiarch build),
+    which should return the machine architecture of the currently running
+    interpreter rather than that of the system (which didn't seem to work
+    properly). The reported machine architectures follow platform-specific
+    naming conventions (e.g. "x86_64" on Linux, but "x64" on Windows).
+    Use normalize=True to reduce those labels (returns one of 'x86_64', 'arm64', 'x86')
+    Example output for common platforms (normalized):
+
+        ('darwin', 'arm64')
+        ('darwin', 'x86_64')
+        ('linux', 'x86_64')
+        ('windows', 'x86_64')
+        ...
+
+    Normalizations:
+
+    * aarch64 -> arm64
+    * x64 -> x86_64
+    * amd64 -> x86_64
+
+
+    """
+    system, machine = _rawPlatform()
+    if normalize:
+        machine = _machineNormalizations.get(machine, machine)
     return system, machine
 
 
@@ -3,9 +3,13 @@ from .synthevent import SynthEvent
 from typing import Sequence
 import csoundengine
 import maelzel.core as mc
-from datetime import datetime
 import os
 import math
+import time
+import itertools
+
+
+_recordingCounter = itertools.count()
 
 
 def collectEvents(events,
@@ -48,12 +52,13 @@ def makeRecordingFilename(ext=".wav", prefix="rec-"):
     """
     path = mc.getWorkspace().recordPath()
     assert ext.startswith(".")
-    base = datetime.now().isoformat(timespec='milliseconds')
-    if prefix:
-        base = prefix + base
-    out = os.path.join(path, base + ext)
-    assert not os.path.exists(out)
-    return out
+    while True:
+        # The counter makes names unique within this process, the check
+        # protects against files left by other processes or sessions
+        base = f"{prefix}{int(time.time() * 1000):013d}-{next(_recordingCounter):04d}"
+        out = os.path.join(path, base + ext)
+        if not os.path.exists(out):
+            return out
 
 
 def nchnlsForEvents(events: list[SynthEvent]) -> int:
@@ -68,6 +68,8 @@ def makeClickTrack(struct: scorestruct.ScoreStruct,
         struct = struct.copy()
         struct.addMeasure(numMeasures=minMeasures - struct.numMeasures())
 
+    clickfade = (0, 0.1)
+
     def _processPart(num: int,
                      den: int,
                      quarterTempo: F,
@@ -77,20 +79,14 @@ def makeClickTrack(struct: scorestruct.ScoreStruct,
                      clickdur: float,
                      subdivisions: Sequence[F] | None = None
                      ) -> tuple[list[Note], F]:
-        events = []
-        if den == 4:
-            for i, n in enumerate(range(num)):
-                pitch = strongPitch if i == 0 else weakPitch
-                ev = Note(pitch, offset=now, dur=clickdur or 1).setPlay(fade=(0, 0.1))
-                events.append(ev)
-                now += 1
-        elif den == 8:
-            for i, n in enumerate(range(num)):
-                pitch = strongPitch if i == 0 else weakPitch
-                ev = Note(pitch, offset=now, dur=clickdur or 0.5).setPlay(fade=(0, 0.1))
-                events.append(ev)
-                now += 0.5
+        if den == 4 or den == 8:
+            beatdur = 1 if den == 4 else 0.5
+            dur = clickdur or beatdur
+            events = [Note(strongPitch if i == 0 else weakPitch, offset=now + i * beatdur, dur=dur).setPlay(fade=clickfade)
+                      for i in range(num)]
+            now += num * beatdur
         elif den == 16:
+            events = []
             if quarterTempo > 80:
                 durationQuarters = num / 4
                 dur = clickdur or durationQuarters
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 import subprocess
-from math import ceil
 
 import emlib.misc
 import numpy as np
@@ -31,6 +30,7 @@ from typing import Callable, Sequence
 
 __all__ = (
     'render',
+    'renderMany',
     'OfflineRenderer'
 )
 
@@ -180,6 +180,12 @@ class OfflineRenderer(renderer.Renderer):
         self.showAtExit = False
         """Display the results at exit if running in jupyter"""
 
+        self.waitAtExit = True
+        """Block until rendering is finished when exiting the context manager.
+        If False, rendering runs in the background and the context manager
+        returns as soon as the csound subprocess has been launched (see
+        :meth:`OfflineRenderer.wait`)"""
+
         self.csoundRenderer: csoundengine.offline.OfflineSession = self._makeCsoundRenderer()
         """The actual csoundengine.OfflineSession"""
 
@@ -447,24 +453,41 @@ class OfflineRenderer(renderer.Renderer):
         elif isinstance(event, SynthEvent):
             if event.initfunc:
                 event.initfunc(event, self)
-            presetname = event.instr
-            instr = self.instrs.get(presetname)
-            if instr is None:
-                preset = self.presetManager.getPreset(presetname)
-                if not preset:
-                    raise ValueError(f"Unknown preset instr: {presetname}")
-                self.preparePreset(preset, event.priority)
-                instr = preset.getInstr()
-            pfields5, dynargs = event._resolveParams(instr)
-            return self.csoundRenderer.sched(instrname=instr.name,
-                                             delay=event.delay,
-                                             dur=event.dur,
-                                             args=pfields5,
-                                             priority=event.priority,
-                                             **dynargs)
+            instr = self._prepareSynthEventInstr(event)
+            return self._schedSynthEvent(event, instr)
         else:
             raise TypeError(f"Expected a SynthEvent or a csound event, got {event}")
 
+    def _prepareSynthEventInstr(self, event: SynthEvent) -> csoundengine.instr.Instr:
+        """
+        Prepare the Instr used by the given event and return it
+
+        Args:
+            event: the event to prepare
+
+        Returns:
+            the csoundengine's Instr corresponding to the event's preset
+        """
+        presetname = event.instr
+        instr = self.instrs.get(presetname)
+        if instr is None:
+            preset = self.presetManager.getPreset(presetname)
+            if not preset:
+                raise ValueError(f"Unknown preset instr: {presetname}")
+            self.preparePreset(preset, event.priority)
+            instr = preset.getInstr()
+        return instr
+
+    def _schedSynthEvent(self, event: SynthEvent, instr: csoundengine.instr.Instr
+                         ) -> csoundengine.schedevent.SchedEvent:
+        pfields5, dynargs = event._resolveParams(instr)
+        return self.csoundRenderer.sched(instrname=instr.name,
+                                         delay=event.delay,
+                                         dur=event.dur,
+                                         args=pfields5,
+                                         priority=event.priority,
+                                         **dynargs)
+
     def schedEvents(self,
                     coreevents: list[SynthEvent],
                     sessionevents: list[csoundengine.event.Event] = None,
@@ -492,7 +515,18 @@ class OfflineRenderer(renderer.Renderer):
             >>> renderer.schedEvents(scale.events(instr='piano'))
             >>> renderer.render('outfile.wav')
         """
-        scoreEvents = [self.schedEvent(ev) for ev in coreevents]
+        # Presets are resolved and prepared once per (preset, priority) pair
+        instrs: dict[tuple[str, int], csoundengine.instr.Instr] = {}
+        scoreEvents = []
+        schedSynthEvent = self._schedSynthEvent
+        for ev in coreevents:
+            if ev.initfunc:
+                ev.initfunc(ev, self)
+            key = (ev.instr, ev.priority)
+            instr = instrs.get(key)
+            if instr is None:
+                instr = instrs[key] = self._prepareSynthEventInstr(ev)
+            scoreEvents.append(schedSynthEvent(ev, instr))
         if sessionevents:
             scoreEvents.extend(self._schedSessionEvent(ev) for ev in sessionevents)
         return csoundengine.schedevent.SchedEventGroup(scoreEvents)
@@ -819,8 +853,9 @@ class OfflineRenderer(renderer.Renderer):
 
         outfile = self._outfile or _playbacktools.makeRecordingFilename()
         logger.info(f"Rendering to {outfile}")
-        self.render(outfile=outfile, wait=True)
+        self.render(outfile=outfile, wait=self.waitAtExit)
         if self.showAtExit:
+            self.wait()
             self.show()
 
     def renderedSample(self) -> audiosample.Sample:
@@ -841,7 +876,7 @@ class OfflineRenderer(renderer.Renderer):
             True if rendering is still in course
         """
         proc = self.lastRenderProc()
-        return proc is not None and proc.poll() is not None
+        return proc is not None and proc.poll() is None
 
     def readSoundfile(self, soundfile: str, chan=0, skiptime=0.) -> int:
         tabproxy = self.csoundRenderer.readSoundfile(path=soundfile, chan=chan,
@@ -884,7 +919,7 @@ class OfflineRenderer(renderer.Renderer):
         """
         proc = self.lastRenderProc()
         if proc is not None and proc.poll() is None:
-            proc.wait(timeout=timeout)
+            proc.wait(timeout=timeout or None)
 
 
 def render(outfile='',
@@ -924,7 +959,10 @@ def render(outfile='',
         ksmps: number of samples per cycle (:ref:`config 'rec.ksmps' <config_rec_ksmps>`)
         nchnls: number of channels of the rendered soundfile
         wait: if True, wait until recording is finished. If None,
-            use the :ref:`config 'rec.blocking' <config_rec_blocking>`
+            use the :ref:`config 'rec.blocking' <config_rec_blocking>`. When used
+            as a context manager rendering blocks at exit unless *wait* is
+            explicitely set to False, in which case the context returns as soon
+            as the render has been launched
         verbose: if True, show the output generated by the csound subprocess
         tail: extra time added at the end of the render, usefull when rendering reverbs or
             long decaying sound. If None, uses use :ref:`config 'rec.extratime' <config_rec_extratime>`
@@ -947,10 +985,20 @@ def render(outfile='',
         >>> a = Chord("A4 C5", start=1, dur=2)
         >>> b = Note("G#4", dur=4)
         >>> render("out.wav", events=[
-        ...     a.events(chain=1),
+        ...     a.events(chan=1),
         ...     b.events(chan=2, gain=0.2)
         ... ])
 
+    Nested lists of events are flattened internally, there is no need to
+    concatenate them beforehand. To build one flat list of events from many
+    objects use :func:`itertools.chain` (``sum(lists, [])`` is quadratic in
+    the number of events):
+
+        >>> import itertools
+        >>> notes = [Note(m, dur=0.25, offset=i*0.25) for i, m in enumerate(range(48, 96))]
+        >>> events = list(itertools.chain.from_iterable(n.events() for n in notes))
+        >>> render("out.wav", events=events)
+
     This function can be also used as a context manager, similar to
     :func:`maelzel.playback.play`. In that case `events` must be ``None``:
 
@@ -985,12 +1033,14 @@ def render(outfile='',
                                           endtime=endtime)
         if show:
             offlinerenderer.showAtExit = True
+        if wait is not None:
+            offlinerenderer.waitAtExit = wait
         return offlinerenderer
     if workspace is None:
         workspace = Workspace.getActive()
     coreEvents, sessionEvents = _playbacktools.collectEvents(events, eventparams=kws, workspace=workspace)
     if not nchnls:
-        nchnls = max(int(ceil(ev.resolvedPosition() + ev.chan)) for ev in coreEvents)
+        nchnls = _playbacktools.nchnlsForEvents(coreEvents) if coreEvents else 0
     renderer = OfflineRenderer(sr=sr, ksmps=ksmps, numchannels=nchnls, tail=tail)
     if coreEvents:
         renderer.schedEvents(coreEvents)
@@ -1002,3 +1052,64 @@ def render(outfile='',
     if run:
         renderer.render(outfile=outfile, wait=wait, verbose=verbose)
     return renderer
+
+
+def renderMany(jobs: Sequence[tuple[str, Sequence[SynthEvent | mobj.MObj | csoundengine.event.Event]]],
+               sr: int = None,
+               ksmps: int = None,
+               verbose: bool = None,
+               tail: float | None = None,
+               maxprocs=0,
+               wait=True,
+               **kws
+               ) -> list[OfflineRenderer]:
+    """
+    Render multiple independent jobs in parallel
+
+    Each job is rendered by its own csound subprocess. Events are collected
+    sequentially (generating events depends on the active workspace) and each
+    render is launched without waiting for the previous ones to finish. At most
+    *maxprocs* renders run at the same time.
+
+    Args:
+        jobs: a list of tuples (outfile, events), where events is a sequence of
+            objects / events as passed to :func:`render`
+        sr: sample rate of the soundfiles (:ref:`config 'rec.sr' <config_rec_sr>`)
+        ksmps: number of samples per cycle (:ref:`config 'rec.ksmps' <config_rec_ksmps>`)
+        verbose: if True, show the output generated by the csound subprocesses
+        tail: extra time added at the end of each render
+        maxprocs: max. number of renders running in parallel. 0 uses the number of cpus
+        wait: if True, wait until all renders are finished
+        kws: any keyword argument is passed to the .events method of the objects
+
+    Returns:
+        a list of :class:`OfflineRenderer`, one for each job
+
+    Example
+    ~~~~~~~
+
+        >>> from maelzel.core import *
+        >>> from maelzel.core import offline
+        >>> scale = Chain([Note(m, 0.5) for m in range(60, 72)])
+        >>> offline.renderMany([(f"scale-{instr}.wav", [scale.events(instr=instr)])
+        ...                     for instr in ('piano', 'sin', 'saw')])
+
+    .. seealso:: :func:`render`
+    """
+    if maxprocs <= 0:
+        maxprocs = os.cpu_count() or 1
+    renderers: list[OfflineRenderer] = []
+    running: list[OfflineRenderer] = []
+    for outfile, events in jobs:
+        if not events:
+            raise ValueError(f"No events to render for outfile '{outfile}'")
+        if len(running) >= maxprocs:
+            running.pop(0).wait()
+        renderer = render(outfile=outfile, events=events, sr=sr, ksmps=ksmps,
+                          verbose=verbose, tail=tail, wait=False, **kws)
+        renderers.append(renderer)
+        running.append(renderer)
+    if wait:
+        for renderer in running:
+            renderer.wait()
+    return renderers
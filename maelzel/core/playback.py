@@ -3,7 +3,6 @@ This module handles playing of events
 
 """
 from __future__ import annotations
-from functools import cache
 
 import numpy as np
 import csoundengine
@@ -274,9 +273,6 @@ def testAudio(duration=4, period=0.5, numChannels: int = None, delay=0.5,
 
     """
     engine = _playEngine(numchannels=numChannels, backend=backend)
-    if not engine:
-        logger.info("Starting engine...")
-        engine = _playEngine(numchannels=numChannels, backend=backend)
     engine.testAudio(dur=duration, period=period, delay=delay)
 
 
@@ -349,9 +345,7 @@ def _playEngine(numchannels: int = None,
 
     .. seealso:: :func:`getAudioDevices`
     """
-    config = Workspace.getActive().config
-    engineName = config['play.engineName']
-    if engine := csoundengine.Engine.activeEngines.get(engineName):
+    if engine := _activeEngine():
         if any(_ is not None for _ in (numchannels, backend, outdev, verbose, buffersize, latency)):
             prettylog('WARNING',
                       "\nThe sound engine has been started already. Any configuration passed "
@@ -360,6 +354,8 @@ def _playEngine(numchannels: int = None,
                       f"with the desired configuration. "
                       f"\nCurrent sound engine: {engine}")
         return engine
+    config = Workspace.getActive().config
+    engineName = config['play.engineName']
     numchannels = numchannels or config['play.numChannels']
     if backend == "?":
         backends = [b.name for b in csoundengine.csoundlib.audioBackends(available=True)]
@@ -428,8 +424,8 @@ def playSession(numchannels: int = None,
 
     .. seealso:: :class:`csoundengine.Session <https://csoundengine.readthedocs.io/en/latest/api/csoundengine.session.Session.html>`
     """
-    if isSessionActive():
-        return _playEngine().session()
+    if (engine := _activeEngine()) is not None:
+        return engine.session()
     engine = _playEngine(numchannels=numchannels, backend=backend, outdev=outdev,
                          verbose=verbose, buffersize=buffersize, latency=latency,
                          numbuffers=numbuffers)
@@ -440,8 +436,17 @@ def isSessionActive() -> bool:
     """
     Returns True if the sound engine is active
     """
-    name = getConfig()['play.engineName']
-    return name in csoundengine.Engine.activeEngines
+    return _activeEngine() is not None
+
+
+def _activeEngine() -> csoundengine.Engine | None:
+    """
+    Returns the active play engine, or None if the engine has not been started
+
+    This reads the config only once, so it can be used instead of
+    calling :func:`isSessionActive` followed by :func:`_playEngine`
+    """
+    return csoundengine.Engine.activeEngines.get(getConfig()['play.engineName'])
 
 
 def _dummySynth(dur=0.001, engine: csoundengine.Engine = None) -> csoundengine.synth.Synth:
@@ -532,15 +537,15 @@ def play(*sources: MObj | Sequence[SynthEvent] | csoundengine.event.Event,
                                                              eventparams=eventparams,
                                                              workspace=Workspace.active)
     numChannels = _playbacktools.nchnlsForEvents(coreevents)
-    if not isSessionActive():
-        _playEngine(numchannels=numChannels)
+    engine = _activeEngine()
+    if engine is None:
+        engine = _playEngine(numchannels=numChannels)
     else:
-        engine = _playEngine()
         assert engine.nchnls is not None
         if engine.nchnls < numChannels:
             logger.error("Some events output to channels outside of the engine's range")
 
-    rtrenderer = RealtimeRenderer()
+    rtrenderer = RealtimeRenderer(engine=engine)
     return rtrenderer.schedEvents(coreevents=coreevents, sessionevents=sessionevents, whenfinished=whenfinished)
 
 
@@ -570,8 +575,14 @@ def _schedEvents(renderer: RealtimeRenderer,
         generated by the sessionevents (one synth per session event)
     """
     needssync = renderer.prepareEvents(events=coreevents, sessionevents=sessionevents)
-    resolvedParams = [ev._resolveParams(instr=presetManager.getInstr(ev.instr))
-                      for ev in coreevents]
+    # Each preset's Instr is looked up only once, the first time it is seen
+    instrs: dict[str, csoundengine.instr.Instr] = {}
+    resolvedParams = []
+    for ev in coreevents:
+        instr = instrs.get(ev.instr)
+        if instr is None:
+            instr = instrs[ev.instr] = presetManager.getInstr(ev.instr)
+        resolvedParams.append(ev._resolveParams(instr=instr))
 
     if whenfinished and renderer.isRealtime():
         lastevent = max(coreevents, key=lambda ev: ev.end if ev.end > 0 else float('inf'))
@@ -586,22 +597,24 @@ def _schedEvents(renderer: RealtimeRenderer,
     if locked:
         renderer.pushLock()  # <---------------- Lock
 
-    synths: list[csoundengine.synth.Synth] = []
-    for coreevent, (pfields5, dynargs) in zip(coreevents, resolvedParams):
+    synths: list[csoundengine.synth.Synth] = [None] * len(coreevents)
+    sched = renderer.sched
+    schedDummyEvent = renderer.schedDummyEvent
+    for i, (coreevent, (pfields5, dynargs)) in enumerate(zip(coreevents, resolvedParams)):
         if coreevent.gain == 0:
-            synths.append(renderer.schedDummyEvent())
+            synths[i] = schedDummyEvent()
             continue
 
-        synth = renderer.sched(PresetDef.presetNameToInstrName(coreevent.instr),
-                               delay=coreevent.delay,
-                               dur=coreevent.dur,
-                               args=pfields5,
-                               priority=coreevent.priority,
-                               whenfinished=coreevent.whenfinished,
-                               **dynargs)
-        synths.append(synth)
+        instr = instrs[coreevent.instr]
+        synth = sched(instr.name,
+                      delay=coreevent.delay,
+                      dur=coreevent.dur,
+                      args=pfields5,
+                      priority=coreevent.priority,
+                      whenfinished=coreevent.whenfinished,
+                      **dynargs)
+        synths[i] = synth
         if coreevent.automationSegments:
-            instr = presetManager.getInstr(coreevent.instr)
             for segment in coreevent.automationSegments:
                 if segment.pretime is None:
                     # a point
@@ -621,10 +634,11 @@ def _schedEvents(renderer: RealtimeRenderer,
                 synth.automate(param=automation.param, pairs=automation.data, delay=automation.delay)
 
     if sessionevents:
-        sessionsynths = []
-        for ev in sessionevents:
-            synth = renderer._schedSessionEvent(ev)
-            sessionsynths.append(synth)
+        sessionsynths = [None] * len(sessionevents)
+        schedSessionEvent = renderer._schedSessionEvent
+        for i, ev in enumerate(sessionevents):
+            synth = schedSessionEvent(ev)
+            sessionsynths[i] = synth
             if ev.automations:
                 for automation in ev.automations:
                     synth.automate(param=automation.param,
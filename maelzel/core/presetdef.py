@@ -1,9 +1,9 @@
 from __future__ import annotations
 import dataclasses
-import math
 import re
+import sys
 import textwrap as _textwrap
-from functools import cache
+from functools import cache, lru_cache
 
 import emlib.textlib as _textlib
 import csoundengine
@@ -22,6 +22,10 @@ if TYPE_CHECKING:
 
 _INSTR_INDENT = "  "
 
+_audiovarRx = re.compile(r"\baout(?P<chan>[1-9])\b")
+_outOpcodeRx = re.compile(r"^.*\b(outch)\b")
+_sfplayRx = re.compile(r"\bsfplay(3m|m|3)?\b")
+
 
 @dataclasses.dataclass
 class ParsedAudiogen:
@@ -40,10 +44,19 @@ class ParsedAudiogen:
     argdocs: dict[str, str] | None = None
 
 
+@lru_cache(maxsize=128)
+def _dedent(code: str) -> str:
+    return _textwrap.dedent(code)
+
+
+@lru_cache(maxsize=128)
 def _parseAudiogen(code: str, check=False) -> ParsedAudiogen:
     """
     Analyzes the audio generating part of an instrument definition
 
+    The result is cached and might be shared between presets with
+    the same code, so it should be treated as read-only
+
     Args:
         code: as passed to PresetDef
         check: if True, will check that the code is well formed
@@ -51,46 +64,46 @@ def _parseAudiogen(code: str, check=False) -> ParsedAudiogen:
     Returns:
         a ParsedAudiogen
     """
-    audiovarRx = re.compile(r"\baout[1-9]\b")
-    outOpcodeRx = re.compile(r"^.*\b(outch)\b")
-    audiovarsList = []
+    audiovars = set()
+    chanmask = 0   # bit i is set if aout<i> is used
+    for match in _audiovarRx.finditer(code):
+        audiovars.add(match.group(0))
+        chanmask |= 1 << int(match.group('chan'))
+
     numOutchs = 0
     audiogenlines = code.splitlines()
-    for line in audiogenlines:
-        # line = _stripComments(line)
-        foundAudiovars = audiovarRx.findall(line)
-        audiovarsList.extend(foundAudiovars)
-        outOpcode = outOpcodeRx.fullmatch(line)
-        if outOpcode is not None:
-            opcode = outOpcode.group(0)
-            args = line.split(opcode)[1].split(",")
-            assert len(args) % 2 == 0
-            numOutchs = len(args) // 2
-
-    if not audiovarsList:
+    # Most audiogens do not call outch, so only scan line by line when needed
+    if 'outch' in code:
+        for line in audiogenlines:
+            outOpcode = _outOpcodeRx.fullmatch(line)
+            if outOpcode is not None:
+                opcode = outOpcode.group(0)
+                args = line.split(opcode)[1].split(",")
+                assert len(args) % 2 == 0
+                numOutchs = len(args) // 2
+
+    if not audiovars:
         logger.debug(f"Invalid audiogen: no output audio signals (aoutx): {code}")
         needsRouting = False
-        audiovars = set()
     else:
-        audiovars = set(audiovarsList)
         needsRouting = numOutchs == 0
 
-    chans = [int(v[4:]) for v in audiovars]
-    maxchan = max(chans) if chans else 0
+    maxchan = chanmask.bit_length() - 1 if chanmask else 0
+    minchan = (chanmask & -chanmask).bit_length() - 1 if chanmask else 0
     # check that there is an audiovar for each channel
     if check:
         if len(audiovars) == 0:
             raise ValueError("audiogen defines no output signals (aout_ variables)")
 
-        for i in range(1, maxchan+1):
-            if f"aout{i}" not in audiovars:
-                raise ValueError("Not all channels are defined", i, audiovars)
+        expectedmask = (1 << (maxchan + 1)) - 2
+        if chanmask != expectedmask:
+            missingmask = expectedmask & ~chanmask
+            missing = (missingmask & -missingmask).bit_length() - 1
+            raise ValueError("Not all channels are defined", missing, audiovars)
 
     numSignals = len(audiovars)
-    if needsRouting:
-        numOuts = int(math.ceil(numSignals/2))*2
-    else:
-        numOuts = numOutchs
+    # when routing, the number of outputs is numSignals rounded up to an even number
+    numOuts = (numSignals + 1) & ~1 if needsRouting else numOutchs
 
     inlineargs = csoundengine.instr.instrtools.parseInlineArgs(audiogenlines)
     if inlineargs:
@@ -101,8 +114,8 @@ def _parseAudiogen(code: str, check=False) -> ParsedAudiogen:
     return ParsedAudiogen(originalAudiogen=code,
                           signals=audiovars,
                           numSignals=numSignals,
-                          minSignal=min(chans) if chans else 0,
-                          maxSignal=max(chans) if chans else 0,
+                          minSignal=minchan,
+                          maxSignal=maxchan,
                           numOutchs=numOutchs,
                           needsRouting=needsRouting,
                           numOutputs=numOuts,
@@ -125,28 +138,9 @@ class GainToVelocityCurve:
     maxvel: int = 127
 
 
-def _makePresetBody(audiogen: str,
-                    numsignals: int,
-                    withEnvelope=True,
-                    withOutput=True,
-                    epilogue='') -> str:
-    """
-    Generate the presets body
-
-    Args:
-        audiogen: the audio generating part, needs to declare aout1, aout2, ...
-        numsignals: the number of audio signals used in augiogen (generaly
-            the result of analyzing the audiogen via `parseAudiogen`
-        withEnvelope: do we generate envelope code?
-        withOutput: do we send the audio to outch? This includes also panning
-        epilogue: any code needed **after** output (things like turning off
-            the event when silent)
+# The constant parts of a preset body are normalized once at import
 
-    Returns:
-        the presets body
-    """
-    # TODO: generate user pargs
-    prologue = r'''
+_presetPrologue = _textlib.reindent(r'''
 |kpos, kgain, idataidx_, inumbps, ibplen, ichan, ifadein, ifadeout, ipchintrp_, ifadekind| 
 
 ; common case (2 breakpoints is the minimum for a simple note)
@@ -171,6 +165,11 @@ iAmps[]      slicearray iArgs, 2, ilastidx_, ibplen
 
 k_time = (timeinstk() - 1) * ksmps/sr  ; use eventtime (csound 6.18)
 
+if ipchintrp_ >= 2 then
+    ; freq interpolation
+    iFreqs[] mtof iPitches
+endif
+
 if ipchintrp_ == 0 then      
     ; linear midi interpolation    
     kpitch, kamp bpf k_time, iTimes, iPitches, iAmps
@@ -181,7 +180,6 @@ elseif (ipchintrp_ == 1) then  ; cos midi interpolation
     kamp interp1d kidx, iAmps, "cos"
     kfreq mtof kpitch
 elseif (ipchintrp_ == 2) then  ; linear freq interpolation
-    iFreqs[] mtof iPitches
     kfreq, kamp bpf k_time, iTimes, iFreqs, iAmps
     kpitch ftom kfreq
 elseif (ipchintrp_ == 3) then  ; cos freq interpolation
@@ -196,42 +194,83 @@ skip_breakpoints:
 ifadein = max:i(ifadein, 1/kr)
 ifadeout = max:i(ifadeout, 1/kr)
 
-    '''
-    # makePresetEnvelope is defined in the preset system's prelude (presetmanager.py)
-    envelope1 = r"""
+    ''')
+
+# makePresetEnvelope is defined in the preset system's prelude (presetmanager.py)
+_presetEnvelope = _textlib.reindent(r"""
     aenv_ = makePresetEnvelope(ifadein, ifadeout, ifadekind)
     aenv_ *= kgain
+    """)
+
+_presetRoutingMono = _textlib.reindent(r"""
+    aL_, aR_ pan2 aout1, kpos
+    outch ichan, aL_, ichan+1, aR_
+    """)
+
+_presetRoutingStereo = _textlib.reindent(r"""
+    kpos = (kpos == -1) ? 0.5 : kpos
+    aL_, aR_ panstereo aout1, aout2, kpos
+    outch ichan, aL_, ichan+1, aR_
+    """)
+
+
+@cache
+def _envelopeLines(numsignals: int, indentation: int) -> str:
+    """
+    The lines applying the envelope to each audio signal (aout1 *= aenv_, ...)
+    """
+    prefix = ' ' * indentation
+    return '\n'.join(f'{prefix}aout{i} *= aenv_' for i in range(1, numsignals+1))
+
+
+@lru_cache(maxsize=256)
+def _makePresetBody(audiogen: str,
+                    numsignals: int,
+                    withEnvelope=True,
+                    withOutput=True,
+                    epilogue='') -> str:
+    """
+    Generate the presets body
+
+    Args:
+        audiogen: the audio generating part, needs to declare aout1, aout2, ...
+        numsignals: the number of audio signals used in augiogen (generaly
+            the result of analyzing the audiogen via `parseAudiogen`
+        withEnvelope: do we generate envelope code?
+        withOutput: do we send the audio to outch? This includes also panning
+        epilogue: any code needed **after** output (things like turning off
+            the event when silent)
+
+    Returns:
+        the presets body
+
+    .. note::
+
+        The result is cached, since many presets share the same audiogen
+        (for example, the builtin presets are redefined for each Workspace)
     """
-    parts = [prologue]
+    # TODO: generate user pargs
+    parts = [_presetPrologue]
     if numsignals == 0:
         withEnvelope = 0
         withOutput = 0
 
     if withEnvelope:
-        parts.append(envelope1)
-        audiovars = [f'aout{i}' for i in range(1, numsignals+1)]
+        parts.append(_presetEnvelope)
         if withOutput:
             # apply envelope at the end
             indentation = _textlib.getIndentation(audiogen)
-            prefix = ' ' * indentation
-            envlines = [f'{prefix}{audiovar} *= aenv_' for audiovar in audiovars]
-            audiogen = '\n'.join([audiogen] + envlines)
+            audiogen = audiogen + '\n' + _envelopeLines(numsignals, indentation)
         else:
+            audiovars = [f'aout{i}' for i in range(1, numsignals+1)]
             audiogen = presetutils.embedEnvelope(audiogen, audiovars, envelope="aenv_")
 
-    parts.append(audiogen)
+    parts.append(_textlib.reindent(audiogen))
     if withOutput:
         if numsignals == 1:
-            routing = r"""
-            aL_, aR_ pan2 aout1, kpos
-            outch ichan, aL_, ichan+1, aR_
-            """
+            routing = _presetRoutingMono
         elif numsignals == 2:
-            routing = r"""
-            kpos = (kpos == -1) ? 0.5 : kpos
-            aL_, aR_ panstereo aout1, aout2, kpos
-            outch ichan, aL_, ichan+1, aR_
-            """
+            routing = _presetRoutingStereo
         else:
             logger.error("Invalid preset. Audiogen:\n")
             logger.error(_textlib.reindent(audiogen, prefix="    "))
@@ -240,10 +279,8 @@ ifadeout = max:i(ifadeout, 1/kr)
                              " any panning/spatialization needed")
         parts.append(routing)
     if epilogue:
-        parts.append(epilogue)
-    parts = [_textlib.reindent(part) for part in parts]
-    body = '\n'.join(parts)
-    return body
+        parts.append(_textlib.reindent(epilogue))
+    return '\n'.join(parts)
 
 
 class PresetDef:
@@ -297,7 +334,7 @@ class PresetDef:
         >>> synthgroup.automate('kcutoff', (0, 500, synthgroup.dur, 4000))
             
     """
-    _builtinVariables = ('kfreq', 'kamp', 'kpitch')
+    _builtinVariables = frozenset(('kfreq', 'kamp', 'kpitch'))
 
     def __init__(self,
                  name: str,
@@ -317,7 +354,7 @@ class PresetDef:
                  ):
         assert isinstance(code, str)
 
-        code = _textwrap.dedent(code)
+        code = _dedent(code)
         parsedAudiogen = _parseAudiogen(code)
         if parsedAudiogen.numSignals == 0:
             envelope = False
@@ -354,7 +391,11 @@ class PresetDef:
         self.epilogue = epilogue
         "Code run after any other code"
 
-        self.args: dict[str, float] | None = args or parsedAudiogen.inlineArgs
+        if not args and parsedAudiogen.inlineArgs:
+            # The parsed audiogen is shared, copy the args to keep them independent
+            args = parsedAudiogen.inlineArgs.copy()
+
+        self.args: dict[str, float] | None = args or None
         "Named args, if present"
 
         self.userDefined = not builtin
@@ -383,12 +424,12 @@ class PresetDef:
 
         self._consolidatedInit: str = ''
         self._instr: csoundengine.instr.Instr | None = None
+        self._htmlCache: dict[tuple[str, bool], str] = {}
 
-        if self.args:
-            for arg in self.args.keys():
-                if arg in self._builtinVariables:
-                    raise ValueError(f"Cannot use builtin variables as arguments "
-                                     f"({arg} is a builtin variable)")
+        if self.args and not self._builtinVariables.isdisjoint(self.args):
+            invalid = ", ".join(sorted(self._builtinVariables.intersection(self.args)))
+            raise ValueError(f"Cannot use builtin variables as arguments "
+                             f"(found: {invalid})")
 
     @cache
     def _argsToAliases(self) -> dict[str, str]:
@@ -414,7 +455,9 @@ class PresetDef:
     @staticmethod
     @cache
     def presetNameToInstrName(presetname: str) -> str:
-        return f'preset:{presetname}'
+        # The name is used as key in csoundengine's instr registry, interning
+        # it makes those lookups identity comparisons
+        return sys.intern(f'preset:{presetname}')
 
     def __repr__(self):
         lines = []
@@ -449,7 +492,7 @@ class PresetDef:
         Returns:
             True if this Preset is based on a soundfont
         """
-        return re.search(r"\bsfplay(3m|m|3)?\b", self.body) is not None
+        return _sfplayRx.search(self.body) is not None
 
     def dump(self):
         if environment.insideJupyter:
@@ -465,6 +508,12 @@ class PresetDef:
         if not workspace.config['jupyterHtmlRepr']:
             return f'<pre style="font-size: 0.9em">{self.__repr__()}</pre>'
 
+        # Syntax highlighting is expensive and the code of a preset does not change
+        # after creation, so the generated html is cached
+        cachekey = (theme, showGeneratedCode)
+        if (html := self._htmlCache.get(cachekey)) is not None:
+            return html
+
         span = _tools.htmlSpan
         faintcolor = ':grey2'
 
@@ -552,7 +601,9 @@ class PresetDef:
             html = csoundengine.csoundlib.highlightCsoundOrc(epilogue, theme=theme)
             html = span(html, fontsize=codefont)
             ps.append(html)
-        return "\n".join(ps)
+        html = "\n".join(ps)
+        self._htmlCache[cachekey] = html
+        return html
 
     def getInstr(self) -> csoundengine.instr.Instr:
         """
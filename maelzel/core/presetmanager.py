@@ -398,6 +398,9 @@ class PresetManager:
                                                  filter="*.sf2", prompt="Select Soundfont",
                                                  ifcancel="No soundfont selected, aborting")
             assert sf2path is not None
+        # The path is embedded in the generated code: normalize it so that the
+        # same soundfont always results in the same preset code
+        sf2path = os.path.abspath(os.path.expanduser(sf2path))
         cfg = Workspace.getActive().config
         if not interpolation:
             interpolation = cfg['play.soundfontInterpolation']
@@ -159,11 +159,8 @@ class Renderer(ABC):
             be used to sync the audio engine if needed.
 
         """
-        presetname = presetdef.name
         needssync = False
-        if presetname not in self.registeredPresets:
-            presetdef = self.presetManager.getPreset(presetname)
-            assert presetdef is not None, f"Preset {presetname} does not exist"
+        if presetdef.name not in self.registeredPresets:
             needssync |= self.registerPreset(presetdef)
         instr = presetdef.getInstr()
         needssync |= self.prepareInstr(instr, priority)
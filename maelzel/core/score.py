@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import itertools
+
 from maelzel.common import F, F0
 from .mobj import MObj, MContainer
 from .event import MEvent
@@ -51,10 +53,11 @@ class Score(MContainer):
                  voices: Sequence[Voice | Chain | MEvent] = (),
                  scorestruct: ScoreStruct | None = None,
                  title=''):
-        asvoices: list[Voice] = [item if isinstance(item, Voice) else _asvoice(item)
-                                 for item in voices]
-        for voice in asvoices:
+        asvoices: list[Voice] = []
+        for item in voices:
+            voice = item if isinstance(item, Voice) else _asvoice(item)
             voice.parent = self
+            asvoices.append(voice)
 
         self.voices: list[Voice] = asvoices
         """the voices of this score"""
@@ -62,7 +65,7 @@ class Score(MContainer):
         super().__init__(label=title, offset=F0, dur=self._calculateDuration())
 
         self._scorestruct = scorestruct
-        self._modified = True
+        self._modified = False
 
     def dump(self, indents=0, forcetext=False) -> None:
         for i, part in enumerate(self.voices):
@@ -230,6 +233,10 @@ class Score(MContainer):
         self._modified = True
         self._dur = None
 
+    def _childChanged(self, child: MObj) -> None:
+        if not self._modified:
+            self._changed()
+
     def _calculateDuration(self) -> F:
         return max(v.dur for v in self.voices) if self.voices else F0
 
@@ -245,7 +252,9 @@ class Score(MContainer):
             voice = voice.asVoice()
         voice.parent = self
         self.voices.append(voice)
-        self._changed()
+        if not self._modified:
+            # The duration is up to date, update it incrementally
+            self._dur = max(self._dur, voice.dur)
 
     @property
     def dur(self) -> F:
@@ -256,10 +265,10 @@ class Score(MContainer):
 
     def scoringParts(self, config: CoreConfig | None = None
                      ) -> list[scoring.UnquantizedPart]:
+        config = config or getConfig()
         parts = []
         for voice in self.voices:
-            voiceparts = voice.scoringParts(config or getConfig())
-            parts.extend(voiceparts)
+            parts.extend(voice.scoringParts(config))
         return parts
 
     def scoringEvents(self,
@@ -268,11 +277,8 @@ class Score(MContainer):
                       parentOffset: F | None = None
                       ) -> list[scoring.Notation]:
         parts = self.scoringParts(config or getConfig())
-        flatevents = []
-        for part in parts:
-            flatevents.extend(part)
         # TODO: deal with groupid
-        return flatevents
+        return list(itertools.chain.from_iterable(part.notations for part in parts))
 
     def _asVoices(self) -> list[chain.Voice]:
         return self.voices
@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import math
 from functools import cache
+from itertools import chain as _chain
 from emlib import mathlib
 import emlib.misc
 import pitchtools as pt
@@ -421,7 +422,7 @@ class SynthEvent:
                  "priority", "position", "linkednext",
                  "numchans", "whenfinished", "properties", 'sustain',
                  'automationSegments', 'automations',
-                 'initfunc', '_initdone')
+                 'initfunc', '_initdone', '_sustainApplied')
 
     dynamicAttributes = (
         'position', 'gain'
@@ -601,6 +602,9 @@ class SynthEvent:
 
         self._initdone = False
 
+        self._sustainApplied = False
+        """Has the sustain been applied to the breakpoints already?"""
+
         self._consolidateDelay()
 
         if self.dur <= 0:
@@ -637,6 +641,8 @@ class SynthEvent:
         if self.linkednext and self.sustain:
             logger.debug(f"A linked event cannot have sustain ({self=}")
             return
+        if self._sustainApplied:
+            return
         if self.sustain > 0:
             last = self.bps[-1]
             assert isinstance(last, list)
@@ -645,6 +651,7 @@ class SynthEvent:
             self.bps.append(bp)
         elif self.sustain < 0:
             self.crop(self.dur + self.sustain)
+        self._sustainApplied = True
 
     @property
     def start(self) -> float:
@@ -942,10 +949,7 @@ class SynthEvent:
         return mergeEvents(events)
 
     def _flatBreakpoints(self) -> list[float]:
-        out = []
-        for bp in self.bps:
-            out.extend(bp)
-        return out
+        return list(_chain.from_iterable(self.bps))
 
     def _resolveParams(self: SynthEvent,
                        instr: csoundengine.instr.Instr
@@ -1006,7 +1010,8 @@ class SynthEvent:
                 dynargs |= self.args
         instrdefaults = instr.defaultPfieldValues()
         pfields5.extend(instrdefaults[len(pfields5):])
-        pfields5.extend(self._flatBreakpoints())
+        # Breakpoints are appended in one pass, without an intermediate list
+        pfields5.extend(_chain.from_iterable(self.bps))
         return pfields5, dynargs
 
     def _resolveParamsGeneric(self: SynthEvent,
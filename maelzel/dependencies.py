@@ -7,10 +7,10 @@ from pathlib import Path
 import os
 import sys
 import logging
+import time
 from datetime import datetime
 import functools
 
-import csoundengine
 from maelzel import _state
 from maelzel._util import getPlatform
 from maelzel.common import getLogger
@@ -19,6 +19,7 @@ from maelzel.common import getLogger
 logger = getLogger('maelzel')
 
 
+@functools.cache
 def csoundLibVersion() -> int | None:
     """
     Query the version of the installed csound lib, or None if not found
@@ -34,10 +35,19 @@ def csoundLibVersion() -> int | None:
     return ctcsound7.VERSION
 
 
+@functools.cache
+def _csoundBinaryPath() -> str | None:
+    """The path of the csound binary, if found in the PATH"""
+    return shutil.which("csound")
+
+
+@functools.cache
 def checkCsound(minversion="6.17", checkBinaryInPath=True) -> str:
     """
     Returns an empty string if csound is installed, otherwise an error message
 
+    The result is cached for the duration of the session (see :func:`resetCaches`)
+
     Args:
         minversion: min. csound version, as "{major}.{minor}"
         checkBinaryInPath: if True, check that the binary 'csound' is in the path
@@ -59,12 +69,25 @@ def checkCsound(minversion="6.17", checkBinaryInPath=True) -> str:
         return f"Csound is too old (detected version: {version/1000}, " \
                f"min. version: {minversion})"
 
-    if checkBinaryInPath and shutil.which("csound") is None:
+    if checkBinaryInPath and _csoundBinaryPath() is None:
         return "Could not find csound in the path (checked via shutil.which)"
 
     return ""
 
 
+def resetCaches() -> None:
+    """
+    Clear any cached results of the dependency checks
+
+    This should be called after installing or removing a dependency
+    within the same session
+    """
+    csoundLibVersion.cache_clear()
+    _csoundBinaryPath.cache_clear()
+    checkCsound.cache_clear()
+    _lilypondBinary.cache_clear()
+
+
 def vampPluginsInstalled(cached=True) -> bool:
     """
     Are the needed VAMP plugins installed?
@@ -104,6 +127,13 @@ def checkVampPlugins(fix=True) -> str:
         return str(err)
 
 
+@functools.cache
+def _lilypondBinary() -> str | None:
+    """The path to the lilypond binary, or None if not found"""
+    from maelzel.music import lilytools
+    return lilytools.findLilypond()
+
+
 def checkLilypond() -> str:
     """
     Check if lilypond is installed
@@ -113,8 +143,7 @@ def checkLilypond() -> str:
         installed
     """
     logger.debug("Checking lilypond")
-    from maelzel.music import lilytools
-    lilybin = lilytools.findLilypond()
+    lilybin = _lilypondBinary()
     if not lilybin:
         return "Could not find lilypond"
     logger.debug(f"lilypond ok. lilypond binary: {lilybin}")
@@ -126,14 +155,16 @@ def _copyFiles(files: list[str], dest: str, verbose=False) -> None:
     for f in files:
         if verbose:
             print(f"Copying file {f} to {dest}")
-        shutil.copy(f, dest)
+        # copyfile uses the platform's fast copy and skips copying permission bits
+        shutil.copyfile(f, os.path.join(dest, os.path.basename(f)))
 
 
+@functools.cache
 def maelzelRootFolder() -> Path:
     """
     Returns the root folder of the maelzel installation
     """
-    return Path(os.path.split(__file__)[0])
+    return Path(__file__).parent
 
 
 def checkCsoundPlugins(fix=True) -> str:
@@ -145,17 +176,28 @@ def checkCsoundPlugins(fix=True) -> str:
     """
     logger.debug("Checking dependencies for csound plugins")
     import risset
-    logger.debug("Reading risset's main index")
-    rissetindex = risset.MainIndex(update=True)
     neededopcodes = {
         'dict_get': 'klib',
         'presetinterp': 'else',
         'weightedsum': 'else',
         'poly': 'poly'
     }
+
+    def _installedOpcodes(index) -> set[str]:
+        return {opcode.name for opcode in index.defined_opcodes()
+                if opcode.name in neededopcodes and opcode.installed}
+
+    # Updating the index involves a network request, so it is only done
+    # if some opcodes are missing and need to be installed
+    logger.debug("Reading risset's main index")
+    rissetindex = risset.MainIndex(update=False)
+    installedopcodes = _installedOpcodes(rissetindex)
+    if len(installedopcodes) < len(neededopcodes):
+        logger.debug("Some opcodes are missing, updating risset's main index")
+        rissetindex = risset.MainIndex(update=True)
+        installedopcodes = _installedOpcodes(rissetindex)
+
     errors = []
-    installedopcodes = {opcode.name for opcode in rissetindex.defined_opcodes()
-                        if opcode.installed}
     for opcodename, pluginname in neededopcodes.items():
         if opcodename not in installedopcodes:
             if fix:
@@ -177,35 +219,45 @@ def checkCsoundPlugins(fix=True) -> str:
     return ''
 
 
+@functools.cache
 def dataPath() -> Path:
     return maelzelRootFolder() / 'data'
 
 
+_vampDataSubfolders = {
+    'darwin': 'macos',
+    'windows': 'windows',
+    'linux': 'linux'
+}
+
+# Files which must be present in the vamp data folder
+_vampKnownFiles = frozenset(('pyin.cat', 'pyin.n3'))
+
+
+@functools.cache
 def vampPluginsDataFolder() -> Path:
-    subfolder = {
-        'darwin': 'macos',
-        'windows': 'windows',
-        'linux': 'linux'
-    }.get(sys.platform, None)
+    subfolder = _vampDataSubfolders.get(sys.platform, None)
     return dataPath() / 'vamp' / subfolder
 
 
 def checkDataFiles() -> bool:
     data = dataPath()
-    if not data.exists():
+    if not os.path.isdir(data):
         print(f"Data path not found: {data}")
         return False
     vampdir = vampPluginsDataFolder()
-    if not vampdir.exists():
+    try:
+        # A single directory read instead of one stat per file
+        with os.scandir(vampdir) as entries:
+            filenames = {entry.name for entry in entries}
+    except FileNotFoundError:
         print(f"Data folder with vamp plugins not found: {vampdir}")
         return False
 
-    knownfiles = ['pyin.cat', 'pyin.n3']
-    for knownfile in knownfiles:
-        path = vampdir / knownfile
-        if not path.exists():
-            print(f"Vamp plugin component {path} not found")
-            return False
+    if missing := _vampKnownFiles - filenames:
+        for knownfile in sorted(missing):
+            print(f"Vamp plugin component {vampdir / knownfile} not found")
+        return False
     return True
 
 
@@ -230,17 +282,18 @@ def installVampPlugins() -> None:
     else:
         subfolder = f'{osname}-{arch}'
     pluginspath = dataPath() / 'vamp' / subfolder
-    if not pluginspath.exists():
+    if not os.path.isdir(pluginspath):
         raise RuntimeError(f"Could not find vamp plugins for {subfolder}. Folder not found: {pluginspath}")
-    components = list(pluginspath.glob("*"))
+    with os.scandir(pluginspath) as entries:
+        components = [(entry.path, entry.name) for entry in entries if entry.is_file()]
     if not components:
         raise RuntimeError(f"Plugins not found in our distribution. "
                            f"Plugins folder: {pluginspath}")
     pluginsDest = vamptools.vampFolder()
     os.makedirs(pluginsDest, exist_ok=True)
     print(f"Installing vamp plugins from {pluginspath} to {pluginsDest}")
-    logger.info(f"Plugins found: {list(pluginspath.glob('*.n3'))}")
-    _copyFiles([component.as_posix() for component in components], pluginsDest, verbose=True)
+    logger.info(f"Plugins found: {[name for _, name in components if name.endswith('.n3')]}")
+    _copyFiles([path for path, _ in components], pluginsDest, verbose=True)
     # This step will fail since vampyhost cached the pluginloader. We need
     # to reload the module, which we cannot do here
     vampplugins = vamptools.listPlugins(cached=False)
@@ -251,8 +304,8 @@ def installVampPlugins() -> None:
               f"but they are not being detected by the built-in vamp host. "
               f"Plugins detected: {vampplugins}")
         print("Components installed: ")
-        for comp in components:
-            print(f"    {comp.name}")
+        for _, name in components:
+            print(f"    {name}")
         msg = ("You might need to restart the python session in order for the installed "
                "plugins to be available to maelzel")
         from maelzel import tui
@@ -266,9 +319,28 @@ def installAssets():
     """
     checkCsoundPlugins(fix=True)
     checkVampPlugins(fix=True)
+    resetCaches()
+
+
+def _csoundengineDependencies(fix=True) -> str:
+    import csoundengine
+    ok = csoundengine.checkDependencies(fix=fix)
+    return '' if ok else 'csoundengine: dependencies not fullfilled or error during check'
+
 
+# Each step is (key, message, check, acceptsFix). The key is used to store the time
+# of the last successful check in the persistent state. If acceptsFix is True the
+# check is called with the fix argument passed to checkDependencies
+_dependencySteps = (
+    ('csound', 'Checking csound', checkCsound, False),
+    ('lilypond', 'Checking lilypond', checkLilypond, False),
+    ('csoundplugins', 'Checking external csound plugins', checkCsoundPlugins, True),
+    ('vamp', 'Checking vamp plugins', checkVampPlugins, True),
+    ('csoundengine', 'Checking csoundengine dependencies', _csoundengineDependencies, True)
+)
 
-def checkDependencies(abortIfErrors=False, fix=True, verbose=False
+
+def checkDependencies(abortIfErrors=False, fix=True, verbose=False, daysSinceLastCheck=0
                       ) -> list[str]:
     """
     Checks the dependencies of all maelzel subpackages
@@ -282,34 +354,32 @@ def checkDependencies(abortIfErrors=False, fix=True, verbose=False
         fix: if True, try to fix errors along the way, if possible. Some
             fixes might require to restart the current python session
         verbose: if True, display information during the checking process
+        daysSinceLastCheck: if given, each individual check is only performed
+            if it has not succeeded within this number of days. Otherwise
+            all checks are performed
 
     Returns:
         a list of errors (or an empty list if no errors where found)
     """
-    def _csoundengineDependencies(fix=True):
-        ok = csoundengine.checkDependencies(fix=fix)
-        return '' if ok else 'csoundengine: dependencies not fullfilled or error during check'
-
-    steps = [
-        ('Checking csound', checkCsound),
-        ('Checking lilypond', checkLilypond),
-        ('Checking external csound plugins', lambda: checkCsoundPlugins(fix=fix)),
-        ('Checking vamp plugins', lambda: checkVampPlugins(fix=fix)),
-        ('Checking csoundengine dependencies', lambda: _csoundengineDependencies(fix=fix))
-    ]
-
     logger.info("Maelzel - checking dependencies")
     errors = []
     echo = print if verbose else logger.debug
-    for msg, step in steps:
+    now = time.time()
+    mininterval = daysSinceLastCheck * 86400
+    for key, msg, step, acceptsFix in _dependencySteps:
+        statekey = f'last_check_{key}'
+        if mininterval and now - _state.state[statekey] < mininterval:
+            echo(f"{msg} -- skipped, checked recently")
+            continue
         echo(msg)
-        err = step()
+        err = step(fix=fix) if acceptsFix else step()
         if err:
             errors.append(err)
             logger.error(f"  ERROR: {err}")
             if abortIfErrors:
                 return errors
         else:
+            _state.state[statekey] = now
             echo("  -- ok")
     if not errors:
         logger.info("Check Dependencies: everything OK!")
@@ -319,7 +389,8 @@ def checkDependencies(abortIfErrors=False, fix=True, verbose=False
             logger.error(f"    {err}")
 
     if not errors:
-        _state.state['last_dependency_check'] = datetime.now().isoformat()
+        _state.state['last_dependency_check'] = datetime.fromtimestamp(now).isoformat()
+        _state.state['last_dependency_check_epoch'] = now
 
     return errors
 
@@ -327,8 +398,8 @@ def checkDependencies(abortIfErrors=False, fix=True, verbose=False
 def printReport(echo=print, updaterisset=False):
     import risset
     import vamp
-    from maelzel.music import lilytools
-    csoundbin = csoundengine.csoundlib.findCsound()
+    import csoundengine
+    csoundbin = _csoundBinaryPath() or csoundengine.csoundlib.findCsound()
 
     echo("Dependencies report")
     echo("-------------------")
@@ -339,7 +410,7 @@ def printReport(echo=print, updaterisset=False):
         echo(f"Csound binary version: {csoundengine.csoundlib.getVersion(useApi=False)}")
     else:
         echo("WARNING: csound binary not found")
-    echo(f"Lilypond binary: {lilytools.findLilypond()}")
+    echo(f"Lilypond binary: {_lilypondBinary()}")
     echo(f"Risset version: {risset.__version__}")
     rissetidx = risset.MainIndex(update=updaterisset)
     rissetidx.list_plugins(installed=True)
@@ -362,12 +433,12 @@ def checkDependenciesIfNeeded(daysSinceLastCheck=0) -> bool:
         logger.info('Skipping dependency check - not first run')
         return True
 
-    lastcheck = datetime.fromisoformat(_state.state['last_dependency_check'])
-    if (datetime.now() - lastcheck).days < daysSinceLastCheck:
+    elapsed = time.time() - _state.state['last_dependency_check_epoch']
+    if elapsed < daysSinceLastCheck * 86400:
         logger.debug("Dependency check not needed")
         return True
 
-    errors = checkDependencies(abortIfErrors=False, fix=True)
+    errors = checkDependencies(abortIfErrors=False, fix=True, daysSinceLastCheck=daysSinceLastCheck)
     if not errors:
         return True
     logger.error(f"Error while checking dependencies: ")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import numpy as np
 from dataclasses import dataclass
+from itertools import chain
 
 import bpf4
 import pitchtools as pt
@@ -190,10 +191,10 @@ class SplitResult:
     """The frequency distribution used to split the spectrum into bands"""
 
     def voicedPartials(self) -> list[Partial]:
-        return sum((tr.partials for tr in self.tracks), [])
+        return list(chain.from_iterable(tr.partials for tr in self.tracks))
 
     def noisePartials(self) -> list[Partial]:
-        return sum((tr.partials for tr in self.noisetracks), [])
+        return list(chain.from_iterable(tr.partials for tr in self.noisetracks))
 
     def partials(self) -> list[Partial]:
         partials = self.voicedPartials()
@@ -33,6 +33,14 @@ except ImportError:
     from fractions import Fraction as _F
 
 
+try:
+    _F(2, 4, _normalize=False)
+    _canSkipNormalization = True
+except TypeError:
+    # fractions.Fraction removed the _normalize argument in python 3.12
+    _canSkipNormalization = False
+
+
 def fractionToDecimal(numerator: int, denominator: int) -> str:
     """
     Converts a fraction to a decimal number with repeating period
@@ -145,7 +153,7 @@ class Rat(_F):
 
     def __floordiv__(self, other: Any) -> int:
         r = _F.__floordiv__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __format__(self, format_spec) -> str:
         if not format_spec:
@@ -154,11 +162,11 @@ class Rat(_F):
 
     def __add__(self, other) -> Rat:
         r = _F.__add__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __radd__(self, other) -> Rat:
         r = _F.__radd__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __round__(self, ndigits: int=None) -> Rat:
         if ndigits is None:
@@ -180,15 +188,15 @@ class Rat(_F):
 
     def __sub__(self, other) -> Rat:
         r = _F.__sub__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __rsub__(self, other) -> Rat:
         r = _F.__rsub__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __mul__(self, other) -> Rat:
         r = _F.__mul__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __divmod__(self, other) -> Tuple[int, Rat]:
         a, b = _F.__divmod__(self, other)
@@ -202,56 +210,74 @@ class Rat(_F):
 
     def __mod__(self, other) -> Rat:
         r = _F.__mod__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __neg__(self) -> Rat:
         r = _F.__neg__(self)
-        return Rat(r.numerator, r.denominator)
+        return Rat.from_fraction(r)
 
     def __pow__(self, other) -> Rat:
         r = _F.__pow__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __rfloordiv__(self, other) -> Rat:
         r = _F.__rfloordiv__(self, other)
-        return Rat(r.numerator, r.denominator)
+        return Rat.from_fraction(r)
 
     def __truediv__(self, other) -> Rat:
         r = _F.__truediv__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __pos__(self) -> Rat:
         return Rat(_F.__pos__(self))
 
     def __rmod__(self, other) -> Rat:
         r = _F.__rmod__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __rmul__(self, other) -> Rat:
         r = _F.__rmul__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __rpow__(self, other) -> Rat:
         r = _F.__rpow__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     def __rtruediv__(self, other) -> Rat:
         r = _F.__rtruediv__(self, other)
-        return Rat(r.numerator, r.denominator) if isinstance(r, _F) else r
+        return Rat.from_fraction(r) if isinstance(r, _F) else r
 
     @classmethod
     def from_float(cls, x: float) -> Rat:
         return cls(*x.as_integer_ratio())
 
+    @classmethod
+    def from_fraction(cls, x: Rational) -> Rat:
+        """
+        Create a Rat from a rational number which is already normalized
+
+        The numerator and denominator of a Fraction are always in lowest terms,
+        so the gcd normalization can be skipped when the base class allows it
+
+        Args:
+            x: a rational number (a Fraction, a Rat, etc.)
+
+        Returns:
+            a Rat with the same value as *x*
+        """
+        if _canSkipNormalization:
+            return cls(x.numerator, x.denominator, _normalize=False)
+        return cls(x.numerator, x.denominator)
+
     def limit_denominator(self, max_denominator=1000000) -> Rat:
         r = _F.limit_denominator(self, max_denominator)
-        return Rat(r.numerator, r.denominator)
+        return Rat.from_fraction(r)
 
 
 def asRat(x) -> Rat:
     if isinstance(x, Rat):
         return x
     elif isinstance(x, Rational):
-        return Rat(x.numerator, x.denominator)
+        return Rat.from_fraction(x)
     else:
         return Rat(x)
\ No newline at end of file
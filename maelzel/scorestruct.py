@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import copy
+import re
 from pathlib import Path
 from dataclasses import dataclass
 from bisect import bisect
 import sys
 import functools
+import itertools
 
 import emlib.textlib
 from emlib import iterlib
@@ -29,6 +30,9 @@ __all__ = (
 )
 
 
+_F60 = F(60)
+
+
 @dataclass
 class TimeInterval:
     start: F
@@ -101,6 +105,9 @@ class TimeSignature:
             part. For example, 7/8 subdivided as 2+3+2 can be expressed as
             TimeSignature((7, 8), subdivisionStruct=(2, 3, 2)).
     """
+    __slots__ = ('parts', 'normalizedParts', 'fusedSignature', 'subdivisionStruct',
+                 '_quarternoteDuration')
+
     def __init__(self,
                  *parts: tuple[int, int],
                  subdivisions: Sequence[int] = ()):
@@ -133,6 +140,8 @@ class TimeSignature:
         Subdivisions as multiples of the fused denominator. 
         """
 
+        self._quarternoteDuration = F(self.fusedSignature[0], self.fusedSignature[1]) * 4
+
     def copy(self) -> TimeSignature:
         return TimeSignature(*self.parts, subdivisions=self.subdivisionStruct)
 
@@ -176,8 +185,7 @@ class TimeSignature:
     @property
     def quarternoteDuration(self) -> F:
         """The duration of this time signature, in quarternotes"""
-        num, den = self.fusedSignature
-        return F(num, den) * 4
+        return self._quarternoteDuration
 
     def __str__(self):
         parts = [f"{num}/{den}" for num, den in self.parts]
@@ -355,11 +363,20 @@ class RehearsalMark:
 
 
 class KeySignature:
+    __slots__ = ('fifths', 'mode')
+
     def __init__(self, fifths: int, mode='major'):
         self.fifths = fifths
         self.mode = mode if mode else 'major'
 
 
+# Matches the common form of a score line, without keywords: [measureIndex, ] timesig [, tempo [, label]]
+# All fields must be non-empty. Anything else, including malformed lines, is left to the
+# general parser, which reports the error
+_scoreLineRx = re.compile(r'(?:(?P<measure>\d+)\s*,\s*)?(?P<timesig>[^,\s/]+/[^,\s]+)'
+                          r'(?:\s*,\s*(?P<tempo>\d+(?:\.\d*)?|\.\d+)(?:\s*,\s*(?P<label>[^,]*[^,\s]))?)?')
+
+
 def _parseScoreStructLine(line: str) -> _ScoreLine:
     """
     parse a line of a ScoreStruct definition
@@ -382,6 +399,12 @@ def _parseScoreStructLine(line: str) -> _ScoreLine:
         is required
     """
     line = line.strip()
+    if '=' not in line and (match := _scoreLineRx.fullmatch(line)):
+        measureS, timesigS, tempoS, label = match.groups()
+        return _ScoreLine(measureIndex=int(measureS) if measureS else None,
+                          timesig=TimeSignature.parse(timesigS),
+                          tempo=float(tempoS) if tempoS else None,
+                          label=label.replace('"', '') if label else '')
     args = []
     keywords = {}
     for part in [_.strip() for _ in line.split(",")]:
@@ -470,7 +493,9 @@ class MeasureDef:
         'properties',
         'maxEighthTempo',
         'parent',
-        'readonly'
+        'readonly',
+        '_durationSecs',
+        '_secsPerQuarter'
     )
 
     def __init__(self,
@@ -493,6 +518,7 @@ class MeasureDef:
         assert isinstance(timesig, TimeSignature), f"Expected a TimeSignature, got {timesig}"
         self._timesig: TimeSignature = timesig
         self._quarterTempo = asF(quarterTempo)
+        self._secsPerQuarter = _F60 / self._quarterTempo
         self.annotation = annotation
         """Any text annotation for this measure"""
 
@@ -523,6 +549,8 @@ class MeasureDef:
         self.readonly = readonly
         """Is this measure definition read only?"""
 
+        self._durationSecs: F | None = None
+
         assert parent is not None
 
     @property
@@ -533,7 +561,10 @@ class MeasureDef:
     @property
     def durationSecs(self) -> F:
         """The duration of this measure in seconds"""
-        return self.durationQuarters * (F(60) / self._quarterTempo)
+        # Cached, invalidated whenever the time signature or the tempo change
+        if self._durationSecs is None:
+            self._durationSecs = self.durationQuarters * self._secsPerQuarter
+        return self._durationSecs
 
     @property
     def timesig(self) -> TimeSignature:
@@ -545,6 +576,7 @@ class MeasureDef:
         if self.readonly:
             raise ValueError("This MeasureDef is readonly")
         self._timesig = TimeSignature.parse(timesig)
+        self._durationSecs = None
         self.timesigInherited = False
         if self.parent:
             self.parent.modified()
@@ -559,6 +591,8 @@ class MeasureDef:
         if self.readonly:
             raise ValueError("This MeasureDef is readonly")
         self._quarterTempo = asF(tempo)
+        self._secsPerQuarter = _F60 / self._quarterTempo
+        self._durationSecs = None
         self.tempoInherited = False
         if self.parent:
             self.parent.modified()
@@ -600,16 +634,18 @@ class MeasureDef:
         return ', '.join(parts)
 
     def __copy__(self):
-        return MeasureDef(timesig=self._timesig,
-                          quarterTempo=self._quarterTempo,
-                          annotation=self.annotation,
-                          timesigInherited=self.timesigInherited,
-                          tempoInherited=self.tempoInherited,
-                          keySignature=self.keySignature,
-                          rehearsalMark=self.rehearsalMark,
-                          barline=self.barline,
-                          readonly=self.readonly,
-                          parent=self.parent)
+        out = MeasureDef(timesig=self._timesig,
+                         quarterTempo=self._quarterTempo,
+                         annotation=self.annotation,
+                         timesigInherited=self.timesigInherited,
+                         tempoInherited=self.tempoInherited,
+                         keySignature=self.keySignature,
+                         rehearsalMark=self.rehearsalMark,
+                         barline=self.barline,
+                         readonly=self.readonly,
+                         parent=self.parent)
+        out._durationSecs = self._durationSecs
+        return out
 
     def copy(self) -> MeasureDef:
         return self.__copy__()
@@ -898,7 +934,7 @@ def measureBeatStructure(timesig: TimeSignature,
 
     weights[0] = 2
 
-    now = F(0)
+    now = F0
     beatOffsets = []
     for i, dur in enumerate(durations):
         beatOffsets.append(now)
@@ -940,7 +976,7 @@ def measureBeatOffsets(timesig: timesig_t,
     beatdurs = beatDurations(timesig,
                              quarterTempo=quarterTempo,
                              subdivisionStructure=subdivstruct)
-    beatOffsets = [F(0)] + list(iterlib.partialsum(beatdurs))
+    beatOffsets = [F0] + list(iterlib.partialsum(beatdurs))
     return beatOffsets
 
 
@@ -1053,6 +1089,10 @@ class ScoreStruct:
         self._prevScoreStruct: ScoreStruct | None = None
         self._needsUpdate = True
         self._lastIndex = 0
+        self._lastTimeIndex = 0
+
+        # Caches the results of timeToLocation, cleared when modified
+        self._timeLocationCache: dict[num_t, tuple[int | None, F]] = {}
 
         self.readonly = False
         """Is this ScoreStruct read-only?"""
@@ -1075,6 +1115,13 @@ class ScoreStruct:
         self._hash: int | None = None
         """Cached hash"""
 
+        self._uniqueTempo: bool | None = None
+        self._uniqueTimesig: bool | None = None
+        self._repr = ''
+
+        # A tuple (key, renderer) holding the last render of this struct
+        self._lastRender: tuple[tuple, Renderer] | None = None
+
         if score:
             if timesig or tempo:
                 raise ValueError("Either a score as string or a timesig / quarterTempo can be given"
@@ -1096,7 +1143,7 @@ class ScoreStruct:
         return self._hash
 
     def __eq__(self, other: ScoreStruct) -> int:
-        return hash(self) == hash(other)
+        return self is other or hash(self) == hash(other)
 
     def _parseScore(self, s: str, initialTempo=60, initialTimeSignature=(4, 4)
                     ) -> None:
@@ -1162,6 +1209,10 @@ class ScoreStruct:
                 line = line.split("#")[0]
             return line.strip()
 
+        # Repeated measures ('.' lines and gaps before an explicit measure index)
+        # are accumulated and added in one call
+        numRepeats = 0
+
         for i, line0 in enumerate(lines):
             line = lineStrip(line0)
             if not line:
@@ -1171,7 +1222,7 @@ class ScoreStruct:
                 if not self.measuredefs:
                     raise ValueError("Cannot repeat last measure definition since there are "
                                      "no measures defined yet")
-                self.addMeasure()
+                numRepeats += 1
                 measureIndex += 1
                 continue
 
@@ -1180,8 +1231,11 @@ class ScoreStruct:
                 mdef.measureIndex = measureIndex + 1
             else:
                 assert mdef.measureIndex > measureIndex
-                if mdef.measureIndex - measureIndex > 1:
-                    self.addMeasure(numMeasures=mdef.measureIndex - measureIndex - 1)
+                numRepeats += mdef.measureIndex - measureIndex - 1
+
+            if numRepeats > 0:
+                self.addMeasure(numMeasures=numRepeats)
+                numRepeats = 0
 
             self.addMeasure(
                 timesig=mdef.timesig,
@@ -1192,6 +1246,9 @@ class ScoreStruct:
             )
             measureIndex = mdef.measureIndex
 
+        if numRepeats > 0:
+            self.addMeasure(numMeasures=numRepeats)
+
     def copy(self) -> ScoreStruct:
         """
         Create a copy of this ScoreStruct
@@ -1200,7 +1257,15 @@ class ScoreStruct:
         s.measuredefs = [m.copy() for m in self.measuredefs]
         for m in s.measuredefs:
             m.parent = s
-        s.modified()
+        if self._needsUpdate:
+            s.modified()
+        else:
+            # The offsets are always replaced, never modified in place, so they
+            # can be shared with the copy
+            s._timeOffsets = self._timeOffsets
+            s._beatOffsets = self._beatOffsets
+            s._quarternoteDurations = self._quarternoteDurations
+            s._needsUpdate = False
         return s
 
     def numMeasures(self) -> int:
@@ -1271,10 +1336,12 @@ class ScoreStruct:
                        tempoInherited=True, barline='', subdivisionStructure=None)
 
         """
-        self._update()
+        if self._needsUpdate:
+            self._update()
 
-        if idx < len(self.measuredefs):
-            measuredef = self.measuredefs[idx]
+        measuredefs = self.measuredefs
+        if idx < len(measuredefs):
+            measuredef = measuredefs[idx]
             assert measuredef.parent is self
             return measuredef
 
@@ -1285,18 +1352,17 @@ class ScoreStruct:
         if not extend:
             if not self.endless:
                 raise IndexError(f"index {idx} out of range. The score has "
-                                 f"{len(self.measuredefs)} measures defined")
+                                 f"{len(measuredefs)} measures defined")
 
             # "outside" of the defined score: return a copy of the last
             # measure so that any modification will not have any effect
             # Make the parent None so that it does not get notified if tempo or timesig
             # change
-            out = self.measuredefs[-1].copy()
+            out = measuredefs[-1].copy()
             out.readonly = True
             return out
 
-        for n in range(len(self.measuredefs)-1, idx):
-            self.addMeasure()
+        self.addMeasure(numMeasures=idx - len(measuredefs) + 1)
 
         mdef = self.measuredefs[-1]
         assert mdef.parent is self
@@ -1364,7 +1430,7 @@ class ScoreStruct:
             timesigInherited = False
         if quarterTempo is None:
             tempoInherited = True
-            quarterTempo = self.measuredefs[-1].quarterTempo if self.measuredefs else F(60)
+            quarterTempo = self.measuredefs[-1].quarterTempo if self.measuredefs else _F60
         else:
             tempoInherited = False
 
@@ -1378,7 +1444,8 @@ class ScoreStruct:
         if not isinstance(timesig, TimeSignature):
             timesig = TimeSignature.parse(timesig)
 
-        self.measuredefs.append(MeasureDef(
+        quarterTempo = asF(quarterTempo)
+        mdef = MeasureDef(
             timesig=timesig,
             quarterTempo=quarterTempo,
             annotation=annotation,
@@ -1389,17 +1456,25 @@ class ScoreStruct:
             keySignature=keySignature,
             barline=barline,
             parent=self,
-            readonly=self.readonly))
+            readonly=self.readonly)
+        self.measuredefs.append(mdef)
 
         if numMeasures > 1:
-            for _ in range(numMeasures - 1):
-                self.measuredefs.append(MeasureDef(
-                    timesig=timesig,
-                    quarterTempo=quarterTempo,
-                    timesigInherited=True,
-                    tempoInherited=True,
-                    parent=self,
-                    readonly=self.readonly))
+            # Each measure gets its own MeasureDef, since measure definitions
+            # can be modified individually (tempo, rehearsal marks, etc.)
+            readonly = self.readonly
+            numdefs = len(self.measuredefs)
+            self.measuredefs.extend(MeasureDef(timesig=timesig,
+                                               quarterTempo=quarterTempo,
+                                               timesigInherited=True,
+                                               tempoInherited=True,
+                                               parent=self,
+                                               readonly=readonly)
+                                    for _ in range(numMeasures - 1))
+            # All repeated measures have the same duration, compute it only once
+            durationSecs = mdef.durationSecs
+            for m in self.measuredefs[numdefs:]:
+                m._durationSecs = durationSecs
         self.modified()
 
     def addRehearsalMark(self, idx: int, mark: RehearsalMark | str, box: str = 'square'
@@ -1469,7 +1544,11 @@ class ScoreStruct:
         """
         if self.endless:
             raise ValueError("An endless score does not have a duration in beats")
-        return asF(sum(m.durationQuarters for m in self.measuredefs))
+        if not self.measuredefs:
+            return F0
+        if self._needsUpdate:
+            self._update()
+        return self._beatOffsets[-1] + self._quarternoteDurations[-1]
 
     def durationSecs(self) -> F:
         """
@@ -1479,7 +1558,11 @@ class ScoreStruct:
         """
         if self.endless:
             raise ValueError("An endless score does not have a duration in seconds")
-        return asF(sum(m.durationSecs for m in self.measuredefs))
+        if not self.measuredefs:
+            return F0
+        if self._needsUpdate:
+            self._update()
+        return self._timeOffsets[-1] + self.measuredefs[-1].durationSecs
 
     def _update(self) -> None:
         if not self._needsUpdate:
@@ -1490,26 +1573,16 @@ class ScoreStruct:
 
         self._fixInheritedAttributes()
 
-        accumTime = F(0)
-        accumBeats = F(0)
-        starts = []
-        quarterDurs = []
-        beatOffsets = []
-
-        for mdef in self.measuredefs:
-            starts.append(accumTime)
-            beatOffsets.append(accumBeats)
-            durBeats = mdef.durationQuarters
-            quarterDurs.append(durBeats)
-            accumTime += F(60) / mdef.quarterTempo * durBeats
-            accumBeats += durBeats
-
-        self._timeOffsets = starts
-        self._beatOffsets = beatOffsets
+        # The offset of each measure is the accumulated duration of all previous measures
+        measuredefs = self.measuredefs
+        quarterDurs = [mdef.durationQuarters for mdef in measuredefs]
+        self._timeOffsets = list(itertools.accumulate([mdef.durationSecs for mdef in measuredefs[:-1]],
+                                                      initial=F0))
+        self._beatOffsets = list(itertools.accumulate(quarterDurs[:-1], initial=F0))
         self._quarternoteDurations = quarterDurs
         self._needsUpdate = False
 
-    def locationToTime(self, measure: int, beat: num_t = F(0)) -> F:
+    def locationToTime(self, measure: int, beat: num_t = F0) -> F:
         """
         Return the elapsed time at the given score location
 
@@ -1522,28 +1595,29 @@ class ScoreStruct:
         """
         if self._needsUpdate: self._update()
 
-        numdefs = len(self.measuredefs)
+        measuredefs = self.measuredefs
+        timeOffsets = self._timeOffsets
+        numdefs = len(measuredefs)
         if measure > numdefs - 1:
             if measure == numdefs and beat == 0:
-                mdef = self.measuredefs[-1]
-                return self._timeOffsets[-1] + mdef.durationSecs
+                mdef = measuredefs[-1]
+                return timeOffsets[-1] + mdef.durationSecs
 
             if not self.endless:
                 raise ValueError("Measure outside score")
 
             last = numdefs - 1
-            lastTime = self._timeOffsets[last]
-            mdef = self.measuredefs[last]
+            lastTime = timeOffsets[last]
+            mdef = measuredefs[last]
             mdur = mdef.durationSecs
-            fractionalDur = beat * 60 / mdef.quarterTempo
+            fractionalDur = beat * mdef._secsPerQuarter
             return lastTime + (measure - last) * mdur + fractionalDur
         else:
-            now = self._timeOffsets[measure]
-            mdef = self.measuredefs[measure]
+            now = timeOffsets[measure]
+            mdef = measuredefs[measure]
             measureBeats = self._quarternoteDurations[measure]
             assert beat <= measureBeats, f"Beat outside measure, measure={mdef}"
-            qtempo = mdef.quarterTempo
-            return now + F(60 * qtempo.denominator, qtempo.numerator) * beat
+            return now + mdef._secsPerQuarter * beat
 
     def tempoAtTime(self, time: num_t) -> F:
         """
@@ -1577,33 +1651,54 @@ class ScoreStruct:
         """
         if self._needsUpdate:
             self._update()
+        elif (location := self._timeLocationCache.get(time)) is not None:
+            return location
 
         if not self.measuredefs:
             raise IndexError("This ScoreStruct is empty")
 
-        time = asF(time)
-        idx = bisect(self._timeOffsets, time)
-        if idx < len(self.measuredefs):
-            m = self.measuredefs[idx-1]
-            assert self._timeOffsets[idx - 1] <= time < self._timeOffsets[idx]
-            dt = time-self._timeOffsets[idx-1]
-            beat = dt*m.quarterTempo/F(60)
+        location = self._timeToLocation(time)
+        # Only locations within the defined measures are cached, since anything
+        # past the end depends on self.endless
+        if location[0] is not None and location[0] < len(self.measuredefs):
+            cache = self._timeLocationCache
+            if len(cache) >= 1024:
+                cache.clear()
+            cache[time] = location
+        return location
+
+    def _timeToLocation(self, time: num_t) -> tuple[int | None, F]:
+        if not isinstance(time, F):
+            time = asF(time)
+        offsets = self._timeOffsets
+        # Consecutive queries tend to fall within the same measure, check the last one first
+        lastidx = self._lastTimeIndex
+        if lastidx + 1 < len(offsets) and offsets[lastidx] <= time < offsets[lastidx + 1]:
+            idx = lastidx + 1
+        else:
+            idx = bisect(offsets, time)
+            self._lastTimeIndex = max(idx - 1, 0)
+        measuredefs = self.measuredefs
+        if idx < len(measuredefs):
+            m = measuredefs[idx-1]
+            assert offsets[idx - 1] <= time < offsets[idx]
+            dt = time-offsets[idx-1]
+            beat = dt / m._secsPerQuarter
             return idx-1, beat
 
         # is it within the last measure?
-        m = self.measuredefs[idx-1]
-        dt = time - self._timeOffsets[idx-1]
+        m = measuredefs[idx-1]
+        dt = time - offsets[idx-1]
         if dt < m.durationSecs:
-            beat = dt*m.quarterTempo/F(60)
+            beat = dt / m._secsPerQuarter
             return idx-1, beat
         # outside score
         if not self.endless:
             return None, F0
-        lastMeas = self.measuredefs[-1]
-        measDur = lastMeas.durationSecs
-        numMeasures = dt / measDur
-        beat = (numMeasures - int(numMeasures)) * lastMeas.durationQuarters
-        return len(self.measuredefs)-1 + int(numMeasures), beat
+        lastMeas = measuredefs[-1]
+        numMeasures, restTime = divmod(dt, lastMeas.durationSecs)
+        beat = restTime / lastMeas.durationSecs * lastMeas.durationQuarters
+        return len(measuredefs)-1 + numMeasures, beat
 
     def beatToLocation(self, beat: num_t) -> tuple[int, F]:
         """
@@ -1648,28 +1743,27 @@ class ScoreStruct:
         if not isinstance(beat, F):
             beat = asF(beat)
 
-        if beat > self._beatOffsets[-1]:
+        beatOffsets = self._beatOffsets
+        if beat > beatOffsets[-1]:
             # past the end
-            rest = beat - self._beatOffsets[-1]
+            rest = beat - beatOffsets[-1]
             if not self.endless:
                 if rest > 0:
                     raise ValueError(f"The given beat ({beat}) is outside the score")
                 return (numdefs, F0)
             beatsPerMeasure = self.measuredefs[-1].durationQuarters
-            idx = numdefs - 1
-            idx += int(rest / beatsPerMeasure)
-            restBeats = rest % beatsPerMeasure
-            return idx, restBeats
+            numMeasures, restBeats = divmod(rest, beatsPerMeasure)
+            return numdefs - 1 + numMeasures, restBeats
         else:
             lastIndex = self._lastIndex
-            lastOffset = self._beatOffsets[lastIndex]
+            lastOffset = beatOffsets[lastIndex]
             if lastOffset <= beat < lastOffset + self._quarternoteDurations[lastIndex]:
                 idx = lastIndex
             else:
-                ridx = bisect(self._beatOffsets, beat)
+                ridx = bisect(beatOffsets, beat)
                 idx = ridx - 1
                 self._lastIndex = idx
-            rest = beat - self._beatOffsets[idx]
+            rest = beat - beatOffsets[idx]
             return idx, rest
 
     def b2t(self, beat: num_t) -> F:
@@ -1707,6 +1801,9 @@ class ScoreStruct:
         .. seealso:: :meth:`~ScoreStruct.timeToBeat`
         """
         meas, offset = self.beatToLocation(beat)
+        if meas < len(self.measuredefs):
+            # Within the defined measures, skip the checks in locationToTime
+            return self._timeOffsets[meas] + self.measuredefs[meas]._secsPerQuarter * offset
         return self.locationToTime(meas, offset)
 
     def remapTo(self, deststruct: ScoreStruct, location: num_t | tuple[int, num_t]) -> F:
@@ -1796,10 +1893,9 @@ class ScoreStruct:
         If it is marked as `endless`, then the last defined measure
         will be returned indefinitely.
         """
-        for mdef in self.measuredefs:
-            yield mdef
+        yield from self.measuredefs
         if not self.endless:
-            raise StopIteration
+            return
         lastmdef = self.measuredefs[-1]
         while True:
             yield lastmdef
@@ -1907,7 +2003,7 @@ class ScoreStruct:
         """
         return self.locationToBeat(*location) if isinstance(location, tuple) else asF(location)
 
-    def locationToBeat(self, measure: int, beat: num_t = F(0)) -> F:
+    def locationToBeat(self, measure: int, beat: num_t = F0) -> F:
         """
         Returns the number of quarter notes up to the given location
 
@@ -1938,8 +2034,10 @@ class ScoreStruct:
         if self._needsUpdate:
             self._update()
 
-        beat = asF(beat)
-        if measure < self.numMeasures():
+        # Fraction arithmetic with an int operand is exact, no need to convert
+        if not isinstance(beat, (F, int)):
+            beat = asF(beat)
+        if measure < len(self.measuredefs):
             # Use the index
             measureOffset = self._beatOffsets[measure]
             quartersInMeasure = self._quarternoteDurations[measure]
@@ -1950,19 +2048,13 @@ class ScoreStruct:
         elif not self.endless:
             raise ValueError(f"This scorestruct has {self.numMeasures()} and is not"
                              f"marked as endless. Measure {measure} is out of scope")
-        # It is endless and out of the defined measures
-        # TODO
-
-        accum = F(0)
-        for i, mdef in enumerate(self.iterMeasureDefs()):
-            if i < measure:
-                accum += mdef.durationQuarters
-            else:
-                if beat > mdef.durationQuarters:
-                    raise ValueError(f"beat {beat} outside measure {i}: {mdef}")
-                accum += asF(beat)
-                break
-        return accum
+        # It is endless and out of the defined measures. All measures past the
+        # end repeat the last measure definition
+        lastIndex = len(self.measuredefs) - 1
+        lastDur = self._quarternoteDurations[lastIndex]
+        if beat > lastDur:
+            raise ValueError(f"beat {beat} outside measure {measure}: {self.measuredefs[-1]}")
+        return self._beatOffsets[lastIndex] + (measure - lastIndex) * lastDur + beat
 
     def measureOffsets(self, startIndex=0, stopIndex=0) -> list[F]:
         """
@@ -2024,7 +2116,15 @@ class ScoreStruct:
         .. seealso:: :meth:`~ScoreStruct.beatDelta`
 
         """
-        startTime = self.locationToTime(*start) if isinstance(start, tuple) else self.beatToTime(start)
+        if isinstance(start, tuple):
+            if isinstance(end, tuple) and start[0] == end[0] < len(self.measuredefs):
+                # Both locations within the same measure
+                if self._needsUpdate:
+                    self._update()
+                return self.measuredefs[start[0]]._secsPerQuarter * (end[1] - start[1])
+            startTime = self.locationToTime(*start)
+        else:
+            startTime = self.beatToTime(start)
         endTime = self.locationToTime(*end) if isinstance(end, tuple) else self.beatToTime(end)
         return endTime - startTime
 
@@ -2087,20 +2187,20 @@ class ScoreStruct:
 
         """
         import tempfile
-        from maelzel.core import environment
+        import os
         import emlib.misc
 
-        outfile = tempfile.mktemp(suffix='.' + fmt)
+        fd, outfile = tempfile.mkstemp(suffix='.' + fmt)
+        os.close(fd)
         self.write(outfile, backend=backend, renderoptions=renderoptions)
 
-        if fmt == 'png':
-            from maelzel.core import jupytertools
-            if environment.insideJupyter and not app:
+        if fmt == 'png' and not app:
+            from maelzel.core import environment
+            if environment.insideJupyter:
+                from maelzel.core import jupytertools
                 jupytertools.jupyterShowImage(outfile, scalefactor=scalefactor, maxwidth=1200)
-            else:
-                emlib.misc.open_with_app(outfile, app=app)
-        else:
-            emlib.misc.open_with_app(outfile, app=app)
+                return
+        emlib.misc.open_with_app(outfile, app=app)
 
     def dump(self) -> None:
         """
@@ -2111,12 +2211,12 @@ class ScoreStruct:
         from maelzel.core import environment
         if environment.insideJupyter:
             from IPython.display import display, HTML
-            display(HTML(self._repr_html_()))
+            display(HTML(self._repr_html_(maxrows=0)))
         else:
             tempo = -1
-            for i, m in enumerate(self.measuredefs):
-                parts = []
-                parts.append(str(m.timesig))
+            lines = []
+            for m in self.measuredefs:
+                parts = [str(m.timesig)]
                 if m.quarterTempo != tempo:
                     parts.append(f", {m.quarterTempo}")
                     tempo = m.quarterTempo
@@ -2128,20 +2228,30 @@ class ScoreStruct:
                     parts.append(f", barline={m.barline}")
                 if m.keySignature:
                     parts.append(f", keySignature={m.keySignature.fifths}")
-                print("".join(parts))
+                lines.append("".join(parts))
+            print("\n".join(lines))
 
     def hasUniqueTempo(self) -> bool:
         """
         Returns True if this ScoreStruct has no tempo changes
         """
-        self._update()
+        if self._needsUpdate:
+            self._update()
 
-        t = self.measuredefs[0].quarterTempo
-        return all(m.quarterTempo == t for m in self.measuredefs)
+        if self._uniqueTempo is None:
+            t = self.measuredefs[0].quarterTempo
+            self._uniqueTempo = all(m.quarterTempo == t for m in self.measuredefs)
+        return self._uniqueTempo
 
     def __repr__(self) -> str:
-        self._update()
+        if self._needsUpdate:
+            self._update()
+        elif self._repr:
+            return self._repr
+        self._repr = self._makeRepr()
+        return self._repr
 
+    def _makeRepr(self) -> str:
         if self.hasUniqueTempo() and self.hasUniqueTimesig():
             m0 = self.measuredefs[0]
             return f'ScoreStruct(tempo={m0.quarterTempo}, timesig={m0.timesig})'
@@ -2161,21 +2271,20 @@ class ScoreStruct:
             return f"ScoreStruct([{s}])"
 
     def __enter__(self):
-        if 'maelzel.core.workspace' in sys.modules:
-            from maelzel.core import workspace
-            w = workspace.getWorkspace()
-            self._prevScoreStruct = w.scorestruct
-            w.scorestruct = self
-        else:
+        # The workspace module is only available if maelzel.core has been imported
+        workspace = sys.modules.get('maelzel.core.workspace')
+        if workspace is None:
             raise RuntimeError("No active maelzel.core Workspace. A ScoreStruct can only be "
                                "called when maelzel.core has been importated")
+        w = workspace.getWorkspace()
+        self._prevScoreStruct = w.scorestruct
+        w.scorestruct = self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         assert self._prevScoreStruct is not None
-        from maelzel.core import workspace
-        workspace.getWorkspace().scorestruct = self._prevScoreStruct
+        sys.modules['maelzel.core.workspace'].getWorkspace().scorestruct = self._prevScoreStruct
 
-    def _repr_html_(self) -> str:
+    def _repr_html_(self, maxrows=200) -> str:
         self._update()
         import emlib.misc
         colnames = ['Meas. Index', 'Timesig', 'Tempo (quarter note)', 'Label', 'Rehearsal', 'Barline']
@@ -2189,7 +2298,10 @@ class ScoreStruct:
         parts = [f'<p><strong>ScoreStruct</strong></p>']
         tempo = -1
         rows = []
-        for i, m in enumerate(self.measuredefs):
+        # Long structures are truncated, use dump to see all measures
+        if not maxrows:
+            maxrows = len(self.measuredefs)
+        for i, m in enumerate(self.measuredefs[:maxrows]):
             # num, den = m.timesig
             if m.quarterTempo != tempo:
                 tempo = m.quarterTempo
@@ -2204,6 +2316,8 @@ class ScoreStruct:
             if haskey:
                 row.append(str(m.keySignature.fifths) if m.keySignature else '-')
             rows.append(row)
+        if len(self.measuredefs) > maxrows:
+            rows.append((f"… ({len(self.measuredefs) - maxrows} more)", "", "", "", "", ""))
         if self.endless:
             rows.append(("...", "", "", "", "", ""))
         rowstyle = 'font-size: small;'
@@ -2211,22 +2325,40 @@ class ScoreStruct:
         parts.append(htmltable)
         return "".join(parts)
 
+    def _renderKey(self) -> tuple:
+        """
+        A key identifying everything in this struct which affects its rendering
+        """
+        measures = tuple((m.timesig, m.quarterTempo, m.annotation, m.barline,
+                          m.rehearsalMark.text if m.rehearsalMark else '',
+                          m.keySignature.fifths if m.keySignature else None)
+                         for m in self.measuredefs)
+        return (self.title, self.composer, measures)
+
     def _render(self, backend: str = None, renderoptions: RenderOptions = None
                 ) -> Renderer:
         self._update()
 
         from maelzel import scoring
+        if not renderoptions:
+            renderoptions = scoring.render.RenderOptions()
+        if backend:
+            renderoptions.backend = backend
+
+        # Reuse the last renderer if neither this struct nor the options changed
+        key = (self._renderKey(), hash(renderoptions))
+        if self._lastRender is not None and self._lastRender[0] == key:
+            return self._lastRender[1]
+
         quantprofile = scoring.quant.QuantizationProfile()
         measures = [scoring.quant.QuantizedMeasure(timesig=m.timesig, quarterTempo=m.quarterTempo,
                                                    quantprofile=quantprofile, beats=[])
                     for m in self.measuredefs]
         part = scoring.quant.QuantizedPart(struct=self, measures=measures, quantprofile=quantprofile)
         qscore = scoring.quant.QuantizedScore([part], title=self.title, composer=self.composer)
-        if not renderoptions:
-            renderoptions = scoring.render.RenderOptions()
-        if backend:
-            renderoptions.backend = backend
-        return scoring.render.renderQuantizedScore(qscore, options=renderoptions)
+        renderer = scoring.render.renderQuantizedScore(qscore, options=renderoptions)
+        self._lastRender = (key, renderer)
+        return renderer
 
     def setTempo(self, tempo: float, reference=1, measureIndex: int = 0) -> None:
         """
@@ -2246,13 +2378,19 @@ class ScoreStruct:
                              f"{len(self)} measures defined")
         quarterTempo = asF(tempo) / asF(reference)
         mdef = self.getMeasureDef(measureIndex, extend=True)
+        if mdef.quarterTempo == quarterTempo and not mdef.tempoInherited:
+            return
         mdef.quarterTempo = quarterTempo
-        mdef.tempoInherited = False
+        # The setter already marks this struct as modified, the following measures
+        # with inherited tempo can be updated in place
+        secsPerQuarter = mdef._secsPerQuarter
         for m in self.measuredefs[measureIndex+1:]:
-            if m.tempoInherited:
-                m.quarterTempo = quarterTempo
-            else:
+            if not m.tempoInherited:
                 break
+            if m._quarterTempo != quarterTempo:
+                m._quarterTempo = quarterTempo
+                m._secsPerQuarter = secsPerQuarter
+                m._durationSecs = None
 
     def setTimeSignature(self, measureIndex, timesig: tuple[int, int] | str | TimeSignature
                          ) -> None:
@@ -2294,6 +2432,10 @@ class ScoreStruct:
         """
         self._needsUpdate = True
         self._hash = None
+        self._uniqueTempo = None
+        self._uniqueTimesig = None
+        self._repr = ''
+        self._timeLocationCache.clear()
 
     def _fixInheritedAttributes(self):
         m0 = self.measuredefs[0]
@@ -2301,11 +2443,16 @@ class ScoreStruct:
         tempo = m0.quarterTempo
         for m in self.measuredefs[1:]:
             if m.tempoInherited:
-                m._quarterTempo = tempo
+                if m._quarterTempo != tempo:
+                    m._quarterTempo = tempo
+                    m._secsPerQuarter = _F60 / tempo
+                    m._durationSecs = None
             else:
                 tempo = m._quarterTempo
             if m.timesigInherited:
-                m._timesig = timesig
+                if m._timesig is not timesig:
+                    m._timesig = timesig
+                    m._durationSecs = None
             else:
                 timesig = m._timesig
 
@@ -2313,12 +2460,13 @@ class ScoreStruct:
         """
         Returns True if this ScoreStruct does not have any time-signature change
         """
-        self._update()
-        lastTimesig = self.measuredefs[0].timesig
-        for m in self.measuredefs:
-            if m.timesig != lastTimesig:
-                return False
-        return True
+        if self._needsUpdate:
+            self._update()
+
+        if self._uniqueTimesig is None:
+            lastTimesig = self.measuredefs[0].timesig
+            self._uniqueTimesig = all(m.timesig == lastTimesig for m in self.measuredefs)
+        return self._uniqueTimesig
 
     def write(self,
               path: str | Path,
@@ -2499,18 +2647,15 @@ def _filledScoreFromStruct(struct: ScoreStruct, pitch='4C') -> maelzel.core.Scor
         the resulting maelzel.core Score
 
     """
-    now = 0
-    events = []
     from maelzel.core import Note, Voice, Score
     import pitchtools
     if isinstance(pitch, (int, float)):
         midinote = float(pitch)
     else:
         midinote = pitchtools.n2m(pitch)
-    for i, measuredef in enumerate(struct.measuredefs):
-        dur = measuredef.durationQuarters
-        if i == len(struct.measuredefs) - 1:
-            events.append(Note(pitch=midinote, offset=now, dur=dur))
-        now += dur
+    lastIndex = len(struct.measuredefs) - 1
+    events = [Note(pitch=midinote,
+                   offset=struct.locationToBeat(lastIndex),
+                   dur=struct.measuredefs[lastIndex].durationQuarters)]
     voice = Voice(events)
     return Score([voice], scorestruct=struct)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from functools import cache
+import numpy as np
 import bpf4
 import visvalingamwyatt
 from emlib import iterlib
@@ -189,16 +190,13 @@ def explodeNotations(notations: list[Notation],
         raise ValueError(f"The max. number of staves must be between between 1 and 4, "
                          f"got {maxstaves}")
 
-    clefevals = clefEvaluators()
-
-    results = {}
-    for clefs in possibleClefs:
-        totalFitness = 0
-        for n in notations:
-            for pitch in n.pitches:
-                clef, fitness = bestClefForPitch(pitch, clefs, evaluators=clefevals)
-                totalFitness += fitness
-        results[clefs] = totalFitness
+    # Evaluate each clef once for all pitches. The fitness of a combination
+    # is the sum, over all pitches, of the fitness of its best clef for that pitch
+    pitches = np.fromiter((pitch for n in notations for pitch in n.pitches), dtype=float)
+    fitnessPerClef = {clef: evaluator.map(pitches)
+                      for clef, evaluator in clefEvaluators().items()}
+    results = {clefs: float(np.max([fitnessPerClef[clef] for clef in clefs], axis=0).sum())
+               for clefs in possibleClefs}
 
     bestClefCombination = max(results.items(), key=lambda pair: pair[1])[0]
     return splitNotationsByClef(notations, clefs=bestClefCombination)
@@ -216,6 +214,13 @@ def splitNotationsByClef(notations: list[Notation],
     clefs = [definitions.clefs[clef] for clef in clefs]
     clefs = sorted(clefs, key=lambda clef: definitions.clefSortOrder[clef])
     parts = {clef: [] for clef in clefs}
+    # Find the best clef for all pitches at once. Clefs are ranked in reverse
+    # alphabetical order so that ties are resolved as in bestClefForPitch
+    pitches = np.fromiter((p for n in notations if not n.isRest for p in n.pitches), dtype=float)
+    rankedClefs = sorted(clefs, reverse=True)
+    fitness = np.array([evaluators[clef].map(pitches) for clef in rankedClefs])
+    bestClefs = [rankedClefs[idx] for idx in fitness.argmax(axis=0)]
+    pitchidx = 0
     lastn = len(notations) - 1
     for nidx, n in enumerate(notations):
         assert isinstance(n, Notation)
@@ -223,8 +228,9 @@ def splitNotationsByClef(notations: list[Notation],
             for part in parts.values():
                 part.append(n.copy())
         else:
-            pitchindexToClef = [n.getClefHint(i) or bestClefForPitch(p, clefs=clefs, evaluators=evaluators)[0]
-                                for i, p in enumerate(n.pitches)]
+            pitchindexToClef = [n.getClefHint(i) or bestClefs[pitchidx + i]
+                                for i in range(len(n.pitches))]
+            pitchidx += len(n.pitches)
             clef0 = pitchindexToClef[0]
             if len(n.pitches) == 1 or all(clef == clef0 for clef in pitchindexToClef):
                 parts[clef0].append(n)
@@ -41,6 +41,9 @@ class UnquantizedPart:
 
     .. seealso:: :class:`~maelzel.scoring.quant.QuantizedPart`,
     """
+    __slots__ = ('notations', 'groupid', 'groupname', 'name', 'shortname',
+                 'quantProfile', 'showName', 'hooks', 'attachments')
+
     def __init__(self,
                  notations: list[Notation],
                  name='',
@@ -191,7 +194,7 @@ class UnquantizedPart:
         """
         True if the notations in this Part extend over the range of one clef
         """
-        midinotes: list[float] = sum((n.pitches for n in self), [])
+        midinotes = itertools.chain.from_iterable(n.pitches for n in self)
         return util.midinotesNeedMultipleClefs(midinotes)
 
     def stack(self) -> None:
@@ -227,14 +230,14 @@ class UnquantizedPart:
         Returns:
             a float representing the mean pitch as midinote
         """
-        pitch, dur = 0., 0.
-        for n in self:
+        pitch, totaldur = 0., 0.
+        for n in self.notations:
             if n.isRest:
                 continue
-            dur = n.duration or 1.
+            dur = float(n.duration or 1)
             pitch += n.meanPitch() * dur
-            dur += dur
-        return pitch / dur
+            totaldur += dur
+        return pitch / totaldur
 
     def fillGaps(self, mingap=F(1, 64)) -> None:
         """
@@ -242,7 +245,7 @@ class UnquantizedPart:
         """
         if not self.hasGaps():
             return
-        self.notations = fillSilences(self.notations, mingap=mingap, offset=0)
+        self.notations = fillSilences(self.notations, mingap=mingap, offset=0, inplace=True)
         assert not self.hasGaps()
 
     def hasGaps(self) -> bool:
@@ -259,6 +262,8 @@ class UnquantizedScore:
     """
     An UnquantizedScore is a list of UnquantizedParts
     """
+    __slots__ = ('parts', 'title')
+
     def __init__(self, parts: list[UnquantizedPart], title: str = ''):
         self.parts = parts
         self.title = title
@@ -288,7 +293,7 @@ def _repairGracenoteAsTargetGliss(notations: list[Notation]) -> bool:
     """
     toBeRemoved = []
     skip = False
-    for n0, n1, n2 in iterlib.window(notations, 3):
+    for n0, n1, n2 in zip(notations, notations[1:], notations[2:]):
         if skip:
             skip = False
             continue
@@ -297,8 +302,10 @@ def _repairGracenoteAsTargetGliss(notations: list[Notation]) -> bool:
             if not n1.hasAttributes():
                 toBeRemoved.append(n1)
                 skip = True
-    for item in toBeRemoved:
-        notations.remove(item)
+    if toBeRemoved:
+        # Filter by identity in one pass, list.remove would compare by equality
+        removeIds = {id(item) for item in toBeRemoved}
+        notations[:] = [n for n in notations if id(n) not in removeIds]
     return len(toBeRemoved) > 0
 
 
@@ -354,7 +361,7 @@ def resolveOffsets(notations: list[Notation], start=F(0), overrideOffset=False
             assert n.duration is not None
             n.offset = now
         now += n.duration
-    for n1, n2 in iterlib.pairwise(notations):
+    for n1, n2 in zip(notations, notations[1:]):
         if n1.end > n2.qoffset:
             raise ValueError(f"Notations are not sorted: {n1}, {n2}")
     removeSmallOverlaps(notations)
@@ -369,7 +376,7 @@ def removeSmallOverlaps(notations: list[Notation], threshold=F(1, 1000)) -> None
     if len(notations) < 2:
         return
     mindur = threshold * 4
-    for n0, n1 in iterlib.pairwise(notations):
+    for n0, n1 in zip(notations, notations[1:]):
         diff = n1.offset - n0.end
         if diff > 0:
             if diff < threshold:
@@ -385,7 +392,8 @@ def removeSmallOverlaps(notations: list[Notation], threshold=F(1, 1000)) -> None
             n0.duration = duration
 
 
-def fillSilences(notations: list[Notation], mingap=F(1, 64), offset: time_t = None
+def fillSilences(notations: list[Notation], mingap=F(1, 64), offset: time_t = None,
+                 inplace=False
                  ) -> list[Notation]:
     """
     Return a list of Notations filled with rests
@@ -397,9 +405,12 @@ def fillSilences(notations: list[Notation], mingap=F(1, 64), offset: time_t = No
         offset: if given, marks the start time to fill. If notations start after
             this offset a rest will be crated from this offset to the start
             of the first notation
+        inplace: if True, notations which need to absorb a small gap or overlap
+            are modified in place instead of being cloned
 
     Returns:
-        a list of new Notations
+        a list of Notations, including the added rests. Notations which
+        already fit are included as is
     """
     assert notations
     assert all(isinstance(n, Notation) and n.offset is not None and n.duration is not None
@@ -412,25 +423,28 @@ def fillSilences(notations: list[Notation], mingap=F(1, 64), offset: time_t = No
     n0 = notations[0]
     if offset is not None and n0.offset is not None and n0.offset > offset:
         out.append(makeRest(duration=n0.offset, offset=offset))
-    for ev0, ev1 in iterlib.pairwise(notations):
+    for ev0, ev1 in zip(notations, notations[1:]):
         assert isinstance(ev0.offset, F) and isinstance(ev0.duration, F)
         gap = ev1.offset - (ev0.offset + ev0.duration)
-        if gap < 0:
-            if abs(gap) < 1e-14 and ev0.duration > 1e-13:
-                out.append(ev0.clone(duration=ev1.qoffset - ev0.qoffset))
-            else:
-                raise ValueError(f"Items overlap, {gap=}, {ev0=}, {ev1=}")
+        if gap == 0:
+            out.append(ev0)
         elif gap > mingap:
             out.append(ev0)
             rest = makeRest(duration=gap, offset=ev0.offset+ev0.duration)
             assert rest.offset is not None and rest.duration is not None
             out.append(rest)
-        else:
+        elif gap < 0 and not (abs(gap) < 1e-14 and ev0.duration > 1e-13):
+            raise ValueError(f"Items overlap, {gap=}, {ev0=}, {ev1=}")
+        elif inplace:
             # adjust the dur of n0 to match start of n1
+            ev0.duration = ev1.qoffset - ev0.qoffset
+            out.append(ev0)
+        else:
             out.append(ev0.clone(duration=ev1.qoffset - ev0.qoffset))
     out.append(notations[-1])
-    for n0, n1 in iterlib.pairwise(out):
-        assert n0.end == n1.offset, f'{n0=}, {n1=}'
+    if util._VALIDATE:
+        for n0, n1 in zip(out, out[1:]):
+            assert n0.end == n1.offset, f'{n0=}, {n1=}'
     return out
 
 
@@ -513,10 +527,17 @@ def packInParts(notations: list[Notation],
         else:
             assert isinstance(group, list)
             if keepGroupsTogether:
-                dur = (max(n.end for n in group if n.end is not None) -
-                       min(n.offset for n in group if n.offset is not None))
-                step = sum(n.meanPitch() for n in group)/len(group)
-                item = packing.Item(obj=group, offset=group[0].offset or 0, dur=dur, step=step)
+                # Gather start, end and pitch of the group in one pass
+                start, end, pitchsum = group[0].offset, group[0].end, 0.
+                for n in group:
+                    nend = n.end
+                    if nend > end:
+                        end = nend
+                    if n.offset < start:
+                        start = n.offset
+                    pitchsum += n.meanPitch()
+                item = packing.Item(obj=group, offset=group[0].offset or 0, dur=end - start,
+                                    step=pitchsum/len(group))
                 items.append(item)
             else:
                 items.extend(packing.Item(obj=n, offset=n.offset or 0, dur=n.duration or 1,
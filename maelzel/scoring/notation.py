@@ -3,6 +3,7 @@ A Notation represents a note/chord/rest
 """
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import cache
 import uuid
 import copy
 import pitchtools as pt
@@ -225,11 +226,7 @@ class Notation:
         # return id(self)
 
     def fusedDurRatio(self) -> F:
-        num, den = 1, 1
-        for ratio in self.durRatios:
-            num *= ratio.numerator
-            den *= ratio.denominator
-        return F(num, den)
+        return _fusedDurRatio(self.durRatios) if self.durRatios else F1
 
     @staticmethod
     def makeRest(duration: time_t,
@@ -966,7 +963,10 @@ class Notation:
         This represents the notated figure (1=quarter, 1/2=eighth note,
         1/4=16th note, etc)
         """
-        return self.duration * self.fusedDurRatio()
+        # Most notations are not within a tuplet
+        if not self.durRatios:
+            return self.duration
+        return self.duration * _fusedDurRatio(self.durRatios)
 
     def setPitches(self, pitches: list[float | str], fixNotenames=False) -> None:
         """
@@ -1686,6 +1686,15 @@ def _transferAttachments(n: Notation, event: maelzel.core.MEvent) -> None:
                 print(f"TODO: implement transfer for {spanner}")
 
 
+@cache
+def _fusedDurRatio(durRatios: tuple[F, ...]) -> F:
+    num, den = 1, 1
+    for ratio in durRatios:
+        num *= ratio.numerator
+        den *= ratio.denominator
+    return F(num, den)
+
+
 def durationsCanMerge(n0: Notation, n1: Notation) -> bool:
     """
     True if these Notations can be merged based on duration and start/end
@@ -1706,17 +1715,11 @@ def durationsCanMerge(n0: Notation, n1: Notation) -> bool:
     dur1 = n1.symbolicDuration()
     sumdur = dur0 + dur1
     num, den = sumdur.numerator, sumdur.denominator
-    if den > 64 or num not in {1, 2, 3, 4, 7}:
-        return False
-
     # Allow: r8 8 + 4 = r8 4.
     # Don't allow: r16 8. + 8. r16 = r16 4. r16
     # grid = F(1, den)
     # if (num == 3 or num == 7) and ((n0.offset % grid) > 0 or (n1.end % grid) > 0):
-
-    if num not in {1, 2, 3, 4, 6, 7, 8, 12, 16, 32}:
-        return False
-    return True
+    return den <= 64 and num in {1, 2, 3, 4, 7}
 
 
 def notationsCanMerge(n0: Notation, n1: Notation) -> bool:
@@ -1737,17 +1740,22 @@ def notationsCanMerge(n0: Notation, n1: Notation) -> bool:
                 durationsCanMerge(n0, n1))
 
     # TODO: decide what to do about spanners
-    if not (
-        n0.tiedNext and
-        n1.tiedPrev and
-        n0.durRatios == n1.durRatios and
-        n0.pitches == n1.pitches
-    ):
+    # Checks are ordered by cost: most pairs fail on the tie flags
+    if not (n0.tiedNext and n1.tiedPrev):
+        return False
+
+    if n0.durRatios != n1.durRatios:
+        return False
+
+    if n0.pitches is not n1.pitches and n0.pitches != n1.pitches:
         return False
 
     if n1.dynamic and n1.dynamic != n0.dynamic:
         return False
 
+    if not n0.gliss and n1.gliss:
+        return False
+
     if n1.attachments:
         if not n0.attachments:
             return False
@@ -1763,9 +1771,6 @@ def notationsCanMerge(n0: Notation, n1: Notation) -> bool:
         if n0.noteheads != n1visiblenoteheads:
             return False
 
-    if not n0.gliss and n1.gliss:
-        return False
-
     if not durationsCanMerge(n0, n1):
         return False
 
@@ -1799,7 +1804,8 @@ def mergeNotationsIfPossible(notations: list[Notation]) -> list[Notation]:
         else:
             out.append(n1)
     assert len(out) <= len(notations)
-    assert sum(n.duration for n in out) == sum(n.duration for n in notations)
+    if util._VALIDATE:
+        assert sum(n.duration for n in out) == sum(n.duration for n in notations)
     return out
 
 
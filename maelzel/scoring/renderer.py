@@ -3,6 +3,7 @@ This module declares the basic classes for all renderers.
 """
 
 from __future__ import annotations
+import os
 from abc import ABC, abstractmethod
 from maelzel.scorestruct import ScoreStruct
 from maelzel.scoring.renderoptions import RenderOptions
@@ -38,6 +39,9 @@ class Renderer(ABC):
         self.options: RenderOptions = options
         """The render options used"""
 
+        self._tempfiles: dict[tuple[str, int], str] = {}
+        """Files written for show/display, as (fmt, hash(options)) -> path"""
+
     def __hash__(self) -> int:
         return hash((hash(self.quantizedScore), hash(self.struct), hash(self.options)))
 
@@ -113,21 +117,38 @@ class Renderer(ABC):
             external = True
 
         if fmt == 'png':
-            from maelzel.core import _tools
-            png = _util.mktemp(suffix='.png')
-            self.write(png)
+            png = self._writeTempfile('png')
             _util.pngShow(png, forceExternal=external, inlineScale=scalefactor)
         elif fmt == 'pdf':
-            outfile = _util.mktemp(suffix=f'.{fmt}')
-            self.write(outfile)
+            outfile = self._writeTempfile('pdf')
             emlib.misc.open_with_app(outfile)
         else:
             raise ValueError(f"fmt should be 'png' or 'pdf', got '{fmt}'")
 
+    def _writeTempfile(self, fmt: str) -> str:
+        """
+        Write the rendered score to a temporary file in the given format
+
+        The file is reused by subsequent calls as long as the render options
+        do not change
+
+        Args:
+            fmt: the format, one of the formats returned by :meth:`writeFormats`
+
+        Returns:
+            the path of the written file
+        """
+        key = (fmt, hash(self.options))
+        path = self._tempfiles.get(key)
+        if path is None or not os.path.exists(path):
+            path = _util.mktemp(suffix=f'.{fmt}', prefix='render-')
+            self.write(path)
+            self._tempfiles[key] = path
+        return path
+
     def _repr_html_(self) -> str:
         scale = config['pngScale']
-        pngfile = _util.mktemp(suffix=".png", prefix="render-")
-        self.write(pngfile)
+        pngfile = self._writeTempfile('png')
         w, h = emlib.img.imgSize(pngfile)
         img = emlib.img.htmlImgBase64(pngfile, removeAlpha=True, width=f'{int(w*scale)}px')
         parts = "1 part" if len(self.quantizedScore) == 1 else f"{len(self.quantizedScore)} parts"
@@ -247,9 +247,8 @@ class RenderOptions:
             >>> modified = defaultoptions.clone(pageSize='A3')
 
         """
-        out = _dataclassreplace(self, **changes)
-        out.check()
-        return out
+        # replace calls __init__, which already checks the new options
+        return _dataclassreplace(self, **changes)
 
     def check(self) -> None:
         """
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 # This module can only import .common from .
 
 
+# Set to True to run the full post-condition checks (used when debugging/testing)
+_VALIDATE = False
+
+
 def asSimplestNumberType(f: F) -> Union[int, float]:
     """
     convert a fraction to the simplest number type it represents
@@ -98,7 +102,7 @@ def measureTimeDuration(timesig: timesig_t, quarterTempo: F) -> F:
     return dur
 
 
-def midinotesNeedMultipleClefs(midinotes: list[float], threshold=1) -> bool:
+def midinotesNeedMultipleClefs(midinotes: Iterable[float], threshold=1) -> bool:
     """
     True if multiple clefs are needed to represent these midinotes
 
@@ -106,7 +110,8 @@ def midinotesNeedMultipleClefs(midinotes: list[float], threshold=1) -> bool:
     among multiple staves.
 
     Args:
-        midinotes: the pitches to evaluate
+        midinotes: the pitches to evaluate. Any iterable is accepted,
+            evaluation stops as soon as the answer is known
         threshold: how many events should be outside a clef's range
             to declare the need for multiple clefs
 
@@ -0,0 +1,30 @@
+import os
+from maelzel.core import *
+
+
+outfile = 'test-offline-wait.wav'
+if os.path.exists(outfile):
+    os.remove(outfile)
+
+# With wait=False the context manager returns as soon as the render is launched
+with render(outfile, wait=False) as r:
+    for i in range(40):
+        Note(60 + i % 12, dur=2).play(delay=i)
+
+proc = r.lastRenderProc()
+assert proc is not None
+
+# isRendering reflects the state of the rendering process
+assert r.isRendering() == (proc.poll() is None)
+
+# wait() with the default timeout (0) waits without a timeout until the
+# render is finished
+r.wait()
+assert proc.returncode is not None
+assert not r.isRendering()
+assert os.path.exists(outfile)
+
+# Waiting on a finished render returns immediately
+r.wait()
+print(f"Rendered to {outfile}")
+print("OK")
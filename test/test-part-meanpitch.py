@@ -0,0 +1,16 @@
+from maelzel.scoring import core
+from maelzel.scoring.notation import makeNote, makeChord, makeRest
+
+# The mean pitch is weighted by duration, rests are skipped
+part = core.UnquantizedPart([makeNote(60, duration=3, offset=0),
+                             makeRest(1, offset=3),
+                             makeNote(72, duration=1, offset=4)])
+meanpitch = part.meanPitch()
+print(meanpitch)
+assert abs(meanpitch - 63) < 1e-9
+
+# A chord contributes its mean pitch
+part = core.UnquantizedPart([makeChord([60, 64], duration=1, offset=0),
+                             makeNote(65, duration=1, offset=1)])
+assert abs(part.meanPitch() - 63.5) < 1e-9
+print("OK")
@@ -0,0 +1,19 @@
+from maelzel.core import *
+from maelzel.core import presetdef
+
+# Both frequency interpolation branches (linear and cos) read iFreqs,
+# so it must be declared once, before the branches
+preset = presetdef.PresetDef('testifreqs', 'aout1 oscili a(kamp), kfreq')
+body = preset.body
+assert body.count('iFreqs[] mtof iPitches') == 1
+declared = body.index('iFreqs[] mtof iPitches')
+assert declared < body.index('(ipchintrp_ == 2)')
+assert declared < body.index('(ipchintrp_ == 3)')
+
+# Render a glissando with cos frequency interpolation, which used to
+# reference an undeclared array
+outfile = 'test-preset-ifreqs.wav'
+note = Note(60, dur=1, gliss=72)
+note.setPlay(pitchinterpol='freqcos')
+note.rec(outfile, instr='sin', wait=True)
+print("OK")
@@ -0,0 +1,15 @@
+import itertools
+from maelzel.scorestruct import ScoreStruct
+
+# Iterating a non-endless ScoreStruct stops after the last defined measure
+s = ScoreStruct('4/4, 60; 3/4; 5/8')
+s.endless = False
+mdefs = list(s)
+assert len(mdefs) == 3
+assert [m.timesig.numerator for m in mdefs] == [4, 3, 5]
+
+# An endless ScoreStruct repeats its last measure indefinitely
+s.endless = True
+mdefs = list(itertools.islice(s.iterMeasureDefs(), 6))
+assert [m.timesig.numerator for m in mdefs] == [4, 3, 5, 5, 5, 5]
+print("OK")
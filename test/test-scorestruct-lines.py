@@ -0,0 +1,32 @@
+from maelzel.scorestruct import ScoreStruct, _parseScoreStructLine
+
+
+def check(line, measureIndex, timesig, tempo, label=''):
+    parsed = _parseScoreStructLine(line)
+    assert parsed.measureIndex == measureIndex, (line, parsed)
+    assert ((parsed.timesig.numerator, parsed.timesig.denominator) if parsed.timesig else None) == timesig, (line, parsed)
+    assert parsed.tempo == tempo, (line, parsed)
+    assert parsed.label == label, (line, parsed)
+
+
+check('3/4', None, (3, 4), None)
+check(' 5/8 , 72 ', None, (5, 8), 72.)
+check('4, 3/4', 4, (3, 4), None)
+check('4, 3/4, 60.5', 4, (3, 4), 60.5)
+check('3/4, 60, "A"', None, (3, 4), 60., 'A')
+check('2, 3/4, 60, Intro', 2, (3, 4), 60., 'Intro')
+check('3/4, 60, label=B', None, (3, 4), 60., 'B')
+
+# Malformed lines must raise instead of being silently accepted
+for line in [', 3/4', '3/4,', '3/4, .', 'x, 3/4']:
+    try:
+        _parseScoreStructLine(line)
+    except ValueError as e:
+        print(f"OK, '{line}' raised: {e}")
+    else:
+        raise AssertionError(f"Line '{line}' should have raised ValueError")
+
+s = ScoreStruct('4/4, 60; 3/4; 2, 5/8, 90; .')
+assert [(m.timesig.numerator, m.timesig.denominator) for m in s.measuredefs] == [(4, 4), (3, 4), (5, 8), (5, 8)]
+assert [m.quarterTempo for m in s.measuredefs] == [60, 60, 90, 90]
+print("OK")
@@ -0,0 +1,21 @@
+from maelzel.scorestruct import ScoreStruct
+
+s = ScoreStruct('4/4, 60; 3/4; 5/8; 4/4, 90; 3/4')
+s.setTempo(120, measureIndex=1)
+tempos = [m.quarterTempo for m in s.measuredefs]
+inherited = [m.tempoInherited for m in s.measuredefs]
+print(tempos, inherited)
+assert tempos == [60, 120, 120, 90, 90]
+# Measures following the tempo change keep inheriting their tempo
+assert inherited == [False, False, True, False, True]
+assert s.locationToTime(3) == 4 + 1.5 + 1.25
+
+# Setting the same tempo again is a no-op
+s.setTempo(120, measureIndex=1)
+assert [m.quarterTempo for m in s.measuredefs] == tempos
+
+# An inherited measure follows later changes of the measure it inherits from
+s.setTempo(30, measureIndex=1)
+assert [m.quarterTempo for m in s.measuredefs] == [60, 30, 30, 90, 90]
+assert s.locationToTime(3) == 4 + 6 + 5
+print("OK")
@@ -0,0 +1,23 @@
+from maelzel.common import F
+from maelzel.scoring import util
+from maelzel.scoring import core
+from maelzel.scoring.notation import makeNote, mergeNotationsIfPossible
+
+# Run the full post-condition checks
+util._VALIDATE = True
+
+# A gap between two notes is filled with a rest
+notes = [makeNote(60, duration=1, offset=0),
+         makeNote(62, duration=1, offset=2)]
+out = core.fillSilences(notes)
+assert len(out) == 3
+assert out[1].isRest and out[1].offset == 1 and out[1].duration == 1
+
+# Two tied eighth notes of the same pitch are merged into a quarter
+n0 = makeNote(60, duration=F(1, 2), offset=0)
+n1 = makeNote(60, duration=F(1, 2), offset=F(1, 2))
+n0.tiedNext = True
+n1.tiedPrev = True
+merged = mergeNotationsIfPossible([n0, n1])
+print(merged)
+assert sum(n.duration for n in merged) == 1
@@ -0,0 +1,19 @@
+from maelzel.core import *
+from maelzel.core.synthevent import SynthEvent
+
+# Resolving the params of an event with sustain must extend it only once,
+# so the same event can be scheduled several times (play, then render, ...)
+ev = SynthEvent(bps=[[0, 60, 0.5], [1, 62, 0.5]], instr='sin', sustain=0.5)
+instr = ev.getPreset().getInstr()
+for _ in range(3):
+    ev._resolveParams(instr)
+    print(ev)
+    assert len(ev.bps) == 3, ev.bps
+    assert abs(ev.dur - 1.5) < 1e-9, ev.dur
+
+# A negative sustain crops the event, also only once
+ev = SynthEvent(bps=[[0, 60, 0.5], [2, 62, 0.5]], instr='sin', sustain=-0.5)
+ev._applySustain()
+ev._applySustain()
+assert abs(ev.dur - 1.5) < 1e-9, ev.dur
+print("OK")